@@ -17,30 +17,91 @@ promotion_detector.py — Organic vs. Paid/Promoted 콘텐츠 구분
 """
 
 import re
+from functools import lru_cache
+from typing import Optional
 
+import numpy as np
+
+from trend_analyzer.batch import PostBatch
 from trend_analyzer.models import SocialPost, PromotionSignal
 
 
-# 스폰서/광고를 나타내는 키워드 패턴 (대소문자 무시)
+# 스폰서/광고를 나타내는 독립 해시태그 (소문자)
+# 앞뒤가 공백(또는 문자열 끝)인 경우만 인정하므로 정규식 없이
+# str.find 위치 + 경계 문자 확인으로 검사합니다.
+# (예: "#ad"는 감지하지만 "#adidas"는 감지하지 않음)
+SPONSOR_HASHTAGS = frozenset({
+    "#ad",
+    "#sponsored",
+    "#광고",
+    "#스폰서",
+})
+
+# 공백 변형을 허용해야 하는 스폰서 문구 패턴 (대소문자 무시)
 SPONSOR_KEYWORDS = [
-    r"(?:^|\s)#ad(?:\s|$)",       # #ad (독립된 해시태그)
-    r"(?:^|\s)#sponsored(?:\s|$)", # #sponsored
-    r"(?:^|\s)#광고(?:\s|$)",      # #광고
-    r"(?:^|\s)#스폰서(?:\s|$)",    # #스폰서
     r"paid\s*partnership",         # Paid partnership
     r"sponsored\s*post",           # Sponsored post
     r"브랜디드\s*콘텐츠",           # 브랜디드 콘텐츠
     r"광고\s*포함",                 # 광고 포함
 ]
 
-# 키워드를 하나의 정규식으로 컴파일 (성능 최적화)
-# 왜 \b 대신 (?:^|\s)를 쓰나요?
-# → \b는 word boundary인데, #은 non-word 문자라서
-#   "#ad" 앞의 \b가 매칭되지 않습니다.
-_SPONSOR_PATTERN = re.compile(
-    "|".join(SPONSOR_KEYWORDS),
-    re.IGNORECASE
-)
+# 각 문구 패턴에 반드시 들어가는 리터럴 (소문자)
+# 이 중 하나라도 텍스트에 있을 때만 정규식을 실행합니다.
+# → 대부분의 일반 게시물은 빠른 부분 문자열 검사만으로 끝납니다.
+_SPONSOR_KEYWORD_ANCHORS = ("partnership", "sponsored", "브랜디드", "광고")
+
+# 문구 패턴을 하나의 정규식으로 컴파일 (성능 최적화)
+# 검사 대상이 이미 소문자 텍스트이므로 IGNORECASE는 필요 없음
+_SPONSOR_PATTERN = re.compile("|".join(SPONSOR_KEYWORDS))
+
+# 키워드 검사 결과 캐시 크기 (텍스트 기준)
+# 재시도·대시보드 갱신·리포스트로 같은 본문이 반복되면 문자열 검사를 건너뜁니다.
+SPONSOR_KEYWORD_CACHE_SIZE = 4096
+
+
+def _has_standalone_hashtag(lowered: str) -> bool:
+    """
+    소문자 텍스트에 SPONSOR_HASHTAGS 중 하나가 독립 토큰으로 있는지 확인합니다.
+
+    토큰 리스트를 만들지 않고, 각 해시태그의 등장 위치에서
+    앞뒤 문자가 공백인지만 확인합니다. (첫 일치 시 즉시 반환)
+    """
+    if "#" not in lowered:
+        return False
+
+    length = len(lowered)
+    for hashtag in SPONSOR_HASHTAGS:
+        start = lowered.find(hashtag)
+        while start != -1:
+            end = start + len(hashtag)
+            if (start == 0 or lowered[start - 1].isspace()) and (
+                end == length or lowered[end].isspace()
+            ):
+                return True
+            start = lowered.find(hashtag, end)
+    return False
+
+
+@lru_cache(maxsize=SPONSOR_KEYWORD_CACHE_SIZE)
+def _contains_sponsor_keyword(lowered: str) -> bool:
+    """
+    소문자 텍스트(SocialPost.text_lower)에서 스폰서/광고 관련 키워드를 찾습니다.
+
+    검사 순서:
+    1. 독립 해시태그 (#ad 등) → 등장 위치의 앞뒤 경계 확인
+    2. 문구 패턴 (Paid partnership 등) → 필수 리터럴이 있을 때만 정규식 실행
+
+    왜 단순 `in` 검사만 쓰지 않나요?
+    → "#adidas"에서 "#ad"를 잘못 감지할 수 있음.
+      해시태그는 토큰 단위로 정확히 일치해야 감지합니다.
+    """
+    if _has_standalone_hashtag(lowered):
+        return True
+
+    for anchor in _SPONSOR_KEYWORD_ANCHORS:
+        if anchor in lowered:
+            return bool(_SPONSOR_PATTERN.search(lowered))
+    return False
 
 
 class PromotionDetector:
@@ -64,6 +125,15 @@ class PromotionDetector:
     WEIGHT_BURST = 0.10          # 초기 급등 패턴
     WEIGHT_BUSINESS = 0.10       # 비즈니스 계정
 
+    # 일괄 판정용 가중치 벡터 (신호 순서: 키워드, 플랫폼 표시, 참여율, 급등, 비즈니스)
+    _WEIGHTS = np.array([
+        WEIGHT_KEYWORD,
+        WEIGHT_PLATFORM_FLAG,
+        WEIGHT_ENGAGEMENT,
+        WEIGHT_BURST,
+        WEIGHT_BUSINESS,
+    ])
+
     def detect(self, post: SocialPost) -> PromotionSignal:
         """
         단일 게시물의 Organic/Paid 여부를 분석합니다.
@@ -74,20 +144,42 @@ class PromotionDetector:
         Returns:
             PromotionSignal (각 신호 + 최종 확률)
         """
+        engagement = post.engagement
+        return self._detect_signals(
+            post.text_lower,
+            post.has_sponsor_label,
+            post.is_business_account,
+            engagement.likes,
+            engagement.comments,
+            engagement.views,
+            post.follower_count,
+        )
+
+    def _detect_signals(
+        self,
+        text_lower: str,
+        has_sponsor_label: bool,
+        is_business_account: bool,
+        likes: int,
+        comments: int,
+        views: int,
+        follower_count: Optional[int],
+    ) -> PromotionSignal:
+        """detect()의 실제 계산부. 판정에 쓰이는 값만 인자로 받습니다."""
         # --- 신호 1: 스폰서 키워드 감지 ---
-        keyword_detected = self._check_sponsor_keywords(post.text)
+        keyword_detected = self._check_sponsor_keywords(text_lower)
 
         # --- 신호 2: 플랫폼 스폰서 표시 ---
-        platform_flag = post.has_sponsor_label
+        platform_flag = has_sponsor_label
 
         # --- 신호 3: 참여율 이상 감지 ---
-        engagement_anomaly = self._check_engagement_anomaly(post)
+        engagement_anomaly = self._check_engagement_anomaly(likes, follower_count)
 
         # --- 신호 4: 초기 급등 패턴 (게시물 단독으로는 판단 어려움 → 참여/조회 비율로 대체) ---
-        burst_pattern = self._check_burst_pattern(post)
+        burst_pattern = self._check_burst_pattern(likes, views, comments)
 
         # --- 신호 5: 비즈니스 계정 여부 ---
-        business_account = post.is_business_account
+        business_account = is_business_account
 
         # --- 최종 확률 계산 ---
         probability = (
@@ -107,17 +199,59 @@ class PromotionDetector:
             promotion_probability=round(probability, 3),
         )
 
-    def _check_sponsor_keywords(self, text: str) -> bool:
+    def detect_batch(self, batch: PostBatch) -> np.ndarray:
         """
-        텍스트에서 스폰서/광고 관련 키워드를 찾습니다.
+        배치 내 모든 게시물의 promotion_probability를 한 번에 계산합니다.
+
+        detect()와 같은 기준을 게시물별 메서드 호출 대신 배열 연산으로 적용합니다.
+        (텍스트 키워드 검사만 게시물마다 수행)
+
+        Args:
+            batch: 게시물 컬럼 배치
 
-        왜 정규식을 사용하나요?
-        → 단순 `in` 검사는 "Shade"에서 "#ad"를 잘못 감지할 수 있음.
-          단어 경계(\b)를 사용하여 정확한 매칭만 수행합니다.
+        Returns:
+            게시물별 promotion_probability 배열 (소수점 3자리 반올림)
         """
-        return bool(_SPONSOR_PATTERN.search(text))
+        texts = batch.texts_lower
+        likes = batch.likes
+        views = batch.views
+        follower_counts = batch.follower_counts
+
+        signals = np.empty((len(texts), 5), dtype=np.float64)
+
+        # --- 신호 1: 스폰서 키워드 감지 ---
+        # 게시물당 수 µs 수준이라 현재 프로세스에서 순차 처리합니다.
+        # (프로세스 풀은 기동/전송 비용이 검사 시간보다 커서 오히려 느림)
+        signals[:, 0] = np.fromiter(
+            map(_contains_sponsor_keyword, texts), dtype=bool, count=len(texts)
+        )
 
-    def _check_engagement_anomaly(self, post: SocialPost) -> bool:
+        # --- 신호 2: 플랫폼 스폰서 표시 ---
+        signals[:, 1] = batch.sponsor_labels
+
+        # --- 신호 3: 참여율 이상 (팔로워 대비 좋아요 10% 초과, 팔로워 정보 없으면 False) ---
+        has_followers = follower_counts != 0
+        signals[:, 2] = has_followers & (
+            likes / np.where(has_followers, follower_counts, 1) > 0.10
+        )
+
+        # --- 신호 4: 초기 급등 패턴 (조회 대비 좋아요 0.5% 미만 또는 댓글 없는 좋아요 급증) ---
+        has_views = (views > 0) & (likes > 0)
+        signals[:, 3] = (
+            has_views & (likes / np.where(has_views, views, 1) < 0.005)
+        ) | ((likes > 100) & (batch.comments == 0))
+
+        # --- 신호 5: 비즈니스 계정 여부 ---
+        signals[:, 4] = batch.business_accounts
+
+        # --- 최종 확률 계산 (가중 합산) ---
+        return np.rint(signals @ self._WEIGHTS * 1000) / 1000
+
+    def _check_sponsor_keywords(self, text_lower: str) -> bool:
+        """소문자 텍스트에서 스폰서/광고 관련 키워드를 찾습니다. (_contains_sponsor_keyword 참고)"""
+        return _contains_sponsor_keyword(text_lower)
+
+    def _check_engagement_anomaly(self, likes: int, follower_count: Optional[int]) -> bool:
         """
         팔로워 수 대비 참여율이 비정상적으로 높은지 판단합니다.
 
@@ -126,15 +260,15 @@ class PromotionDetector:
         - 10% 초과 → 비정상 (인위적 부스트 의심)
         - 팔로워 정보 없으면 판단 불가 (False)
         """
-        if not post.follower_count or post.follower_count == 0:
+        if not follower_count or follower_count == 0:
             return False
 
-        engagement_rate = post.engagement.likes / post.follower_count
+        engagement_rate = likes / follower_count
 
         # 참여율 10% 초과는 비정상적으로 높음
         return engagement_rate > 0.10
 
-    def _check_burst_pattern(self, post: SocialPost) -> bool:
+    def _check_burst_pattern(self, likes: int, views: int, comments: int) -> bool:
         """
         프로모션 특유의 '초기 급등' 패턴을 감지합니다.
 
@@ -146,10 +280,6 @@ class PromotionDetector:
         - 단일 게시물의 스냅샷만으로는 시계열 패턴 분석이 제한적입니다.
           시계열 데이터가 있으면 더 정밀한 분석이 가능합니다.
         """
-        likes = post.engagement.likes
-        views = post.engagement.views
-        comments = post.engagement.comments
-
         # 조회수 대비 참여율이 극도로 낮은 경우 (광고 노출)
         if views > 0 and likes > 0:
             like_to_view_ratio = likes / views
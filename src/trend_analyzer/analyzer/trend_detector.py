@@ -12,16 +12,28 @@ trend_detector.py — 트렌드 감지 엔진 (핵심 알고리즘)
 """
 
 import math
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
 
+import numpy as np
+
+from trend_analyzer.batch import PLATFORM_CODES, PostBatch
 from trend_analyzer.config import settings
 from trend_analyzer.models import (
-    SocialPost, Platform, TrendResult, PromotionLabel
+    SocialPost, Platform, TrendResult, PromotionLabel,
+    PAID_THRESHOLD, ORGANIC_THRESHOLD,
 )
 from trend_analyzer.analyzer.promotion_detector import PromotionDetector
 
 
+# Organic/Paid 판정 → 정수 코드 (np.bincount로 한 번에 집계하기 위함)
+_LABEL_CODES = {
+    PromotionLabel.ORGANIC: 0,
+    PromotionLabel.PAID: 1,
+    PromotionLabel.UNCERTAIN: 2,
+}
+
+
 class TrendDetector:
     """
     트렌드 감지 엔진.
@@ -52,13 +64,24 @@ class TrendDetector:
         self.boost = cross_platform_boost or settings.cross_platform_boost
         self._promo_detector = PromotionDetector()
 
-    def analyze(self, topic: str, posts: list[SocialPost]) -> TrendResult:
+    def analyze(
+        self,
+        topic: str,
+        posts: list[SocialPost] | PostBatch,
+        now: Optional[datetime] = None,
+    ) -> TrendResult:
         """
         주어진 토픽의 게시물을 종합 분석합니다.
 
         Args:
             topic: 분석 중인 토픽/키워드
-            posts: 수집된 전체 게시물 리스트 (Threads + Instagram 혼합)
+            posts: 수집된 전체 게시물 리스트 (Threads + Instagram 혼합).
+                   여러 플랫폼 수집은 scrapers.gather_search()로 동시에 실행한 뒤
+                   결과를 합쳐서 전달하세요.
+                   이미 만들어 둔 PostBatch를 넘기면 컬럼 변환을 건너뜁니다.
+                   (같은 게시물 묶음을 여러 번 분석할 때 유용)
+            now: 게시물 나이 계산 기준 시각 (기본: 현재 시각).
+                 분석 1회당 한 번만 정해지며, 고정하면 결과가 결정적이 됩니다.
 
         Returns:
             TrendResult 모델 (점수, 판정, 세부 정보 포함)
@@ -66,19 +89,25 @@ class TrendDetector:
         if not posts:
             return TrendResult(topic=topic)
 
-        # --- 플랫폼별 분리 ---
-        threads_posts = [p for p in posts if p.platform == Platform.THREADS]
-        ig_posts = [p for p in posts if p.platform == Platform.INSTAGRAM]
+        # --- 게시물 → 컬럼 배열 (한 번만 순회) ---
+        # 이후 모든 지표는 필드별 배열 연산으로 계산합니다.
+        batch = posts if isinstance(posts, PostBatch) else PostBatch.from_posts(posts)
+        total = len(batch)
+        ages = batch.ages_in_hours(now if now is not None else datetime.now())
+        engagement = batch.engagement
+
+        threads_count = int(np.count_nonzero(batch.platforms == PLATFORM_CODES[Platform.THREADS]))
+        ig_count = total - threads_count
 
         # --- 1. Velocity Score 계산 ---
-        velocity = self._calculate_velocity(posts)
+        velocity = self._calculate_velocity(ages, engagement)
 
         # --- 2. Volume Score 계산 ---
-        volume = self._calculate_volume(len(posts))
+        volume = self._calculate_volume(total)
 
         # --- 3. Cross-Platform Amplification 계산 ---
-        is_cross = bool(threads_posts) and bool(ig_posts)
-        amplification = self._calculate_amplification(posts, is_cross)
+        is_cross = threads_count > 0 and ig_count > 0
+        amplification = self._calculate_amplification(engagement, is_cross)
 
         # --- 최종 트렌드 점수 (가중 합산) ---
         trend_score = (velocity * 0.4) + (volume * 0.3) + (amplification * 0.3)
@@ -86,13 +115,16 @@ class TrendDetector:
         trend_score = max(0.0, min(100.0, trend_score))
 
         # --- Organic / Paid 분석 ---
-        promo_results = self._analyze_promotions(posts)
-        organic_count = sum(1 for r in promo_results if r == PromotionLabel.ORGANIC)
-        paid_count = sum(1 for r in promo_results if r == PromotionLabel.PAID)
-        uncertain_count = sum(1 for r in promo_results if r == PromotionLabel.UNCERTAIN)
+        probabilities = self._promo_detector.detect_batch(batch)
+        # PromotionSignal.label과 같은 기준 (models의 PAID_THRESHOLD / ORGANIC_THRESHOLD)
+        label_codes = np.full(total, _LABEL_CODES[PromotionLabel.UNCERTAIN], dtype=np.uint8)
+        label_codes[probabilities >= PAID_THRESHOLD] = _LABEL_CODES[PromotionLabel.PAID]
+        label_codes[probabilities <= ORGANIC_THRESHOLD] = _LABEL_CODES[PromotionLabel.ORGANIC]
+        organic_count, paid_count, uncertain_count = (
+            int(count) for count in np.bincount(label_codes, minlength=3)
+        )
 
         # 주된 판정: 과반수 기준
-        total = len(posts)
         if paid_count > total * 0.5:
             dominant_label = PromotionLabel.PAID
         elif organic_count > total * 0.5:
@@ -102,12 +134,8 @@ class TrendDetector:
 
         organic_ratio = organic_count / total if total > 0 else 1.0
 
-        # --- 상위 참여 게시물 선정 (최대 5개) ---
-        top_posts = sorted(
-            posts,
-            key=lambda p: p.engagement.total_engagement,
-            reverse=True
-        )[:5]
+        # --- 상위 참여 게시물 (최대 5개, 참여도 내림차순) ---
+        top_posts = [batch.posts[i] for i in self._select_top_indices(engagement, 5)]
 
         return TrendResult(
             topic=topic,
@@ -116,8 +144,8 @@ class TrendDetector:
             amplification_score=round(amplification, 1),
             trend_score=round(trend_score, 1),
             total_posts=total,
-            threads_count=len(threads_posts),
-            instagram_count=len(ig_posts),
+            threads_count=threads_count,
+            instagram_count=ig_count,
             is_cross_platform=is_cross,
             organic_count=organic_count,
             paid_count=paid_count,
@@ -127,7 +155,7 @@ class TrendDetector:
             top_posts=top_posts,
         )
 
-    def _calculate_velocity(self, posts: list[SocialPost]) -> float:
+    def _calculate_velocity(self, ages: np.ndarray, engagement: np.ndarray) -> float:
         """
         Velocity Score (0~100) 계산.
 
@@ -138,37 +166,27 @@ class TrendDetector:
 
         왜 지수 감쇠(exponential decay)?
         → 1시간 전 게시물이 12시간 전 게시물보다 트렌드 판단에 더 중요하기 때문
+
+        Args:
+            ages: 게시물별 나이 (시간 단위)
+            engagement: 게시물별 총 참여 수
         """
-        if not posts:
+        if ages.size == 0:
             return 0.0
 
-        now = datetime.now()
-        window_start = now - timedelta(hours=self.velocity_window)
+        # 게시물 나이 (최소 0.1시간 — 0으로 나누기 방지)
+        ages = np.maximum(ages, 0.1)
 
-        weighted_velocities: list[float] = []
+        # 지수 감쇠: 최신일수록 가중치 ≈ 1.0
+        # 시간 윈도우 밖의 게시물은 마스크로 0.1을 덮어씀 (분기 없이 약하게 기여)
+        time_weights = np.exp(-0.3 * ages)
+        np.copyto(time_weights, 0.1, where=ages > self.velocity_window)
 
-        for post in posts:
-            # 게시물 나이 (시간)
-            # created_at이 timezone-aware일 수 있으므로 naive로 변환
-            created = post.created_at.replace(tzinfo=None)
-            age_hours = max((now - created).total_seconds() / 3600, 0.1)
-
-            # 시간 윈도우 밖의 게시물도 약하게 기여
-            if created < window_start:
-                time_weight = 0.1  # 윈도우 밖: 낮은 가중치
-            else:
-                # 지수 감쇠: 최신일수록 가중치 ≈ 1.0
-                time_weight = math.exp(-0.3 * age_hours)
-
-            # 시간당 참여도
-            engagement_per_hour = post.engagement.total_engagement / age_hours
-            weighted_velocities.append(engagement_per_hour * time_weight)
-
-        if not weighted_velocities:
-            return 0.0
-
-        # 평균 가중 velocity
-        avg_velocity = sum(weighted_velocities) / len(weighted_velocities)
+        # 평균 가중 velocity (시간당 참여도 × 시간 가중치)
+        # 중간 배열을 새로 만들지 않도록 in-place 연산
+        time_weights *= engagement
+        time_weights /= ages
+        avg_velocity = float(time_weights.mean())
 
         # 로그 스케일 정규화 (0~100)
         # log(1 + x)로 극단값 완화, 1000을 기준점으로 100점 매핑
@@ -191,7 +209,7 @@ class TrendDetector:
 
     def _calculate_amplification(
         self,
-        posts: list[SocialPost],
+        engagement: np.ndarray,
         is_cross_platform: bool
     ) -> float:
         """
@@ -206,10 +224,10 @@ class TrendDetector:
         → 같은 토픽이 여러 플랫폼에서 동시에 뜨면
           진짜 사회적 트렌드일 가능성이 높기 때문
         """
-        if not posts:
+        if engagement.size == 0:
             return 0.0
 
-        total_engagement = sum(p.engagement.total_engagement for p in posts)
+        total_engagement = float(engagement.sum())
 
         # 로그 정규화 기본 점수 (10000 참여를 기준점으로)
         base_score = min(
@@ -224,9 +242,26 @@ class TrendDetector:
 
         return base_score
 
-    def _analyze_promotions(self, posts: list[SocialPost]) -> list[PromotionLabel]:
-        """각 게시물의 Organic/Paid 판정을 일괄 수행합니다."""
-        return [
-            self._promo_detector.detect(post).label
-            for post in posts
-        ]
+    def _select_top_indices(self, engagement: np.ndarray, k: int) -> np.ndarray:
+        """
+        참여도 상위 k개 게시물의 인덱스를 내림차순으로 반환합니다.
+
+        왜 전체 정렬을 하지 않나요?
+        → k개만 필요하므로 부분 선택(np.partition, O(N)) 후
+          후보 k개만 정렬합니다.
+        참여도가 같으면 먼저 수집된 게시물이 우선합니다.
+        """
+        total = engagement.size
+        k = min(k, total)
+        if k == 0:
+            return np.empty(0, dtype=np.intp)
+
+        # k번째로 큰 참여도 — 이보다 큰 게시물은 모두 포함,
+        # 같은 값은 앞선 게시물부터 남은 자리만큼 포함
+        kth_value = np.partition(engagement, total - k)[total - k]
+        above = np.flatnonzero(engagement > kth_value)
+        ties = np.flatnonzero(engagement == kth_value)[: k - above.size]
+        candidates = np.concatenate((above, ties))
+
+        # 후보 k개만 정렬: 참여도 내림차순 → 인덱스 오름차순
+        return candidates[np.lexsort((candidates, -engagement[candidates]))]
@@ -0,0 +1,115 @@
+"""
+batch.py — 게시물 컬럼(SoA) 배치
+
+역할: 게시물 리스트를 필드별 NumPy 배열로 변환합니다.
+
+왜 필요한가요?
+→ 분석기는 게시물마다 일부 필드(작성 시각, 참여 수치 등)만 사용합니다.
+  필드별로 연속된 배열에 담아 두면 한 번의 변환 후
+  velocity, 참여율 이상, 급등 패턴 등을 모두 배열 연산으로 계산할 수 있습니다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from trend_analyzer.models import Platform, SocialPost
+
+
+# 플랫폼 → 정수 코드 (platforms 배열에 저장되는 값)
+PLATFORM_CODES = {
+    Platform.THREADS: 0,
+    Platform.INSTAGRAM: 1,
+}
+
+# 게시물 루프용 상수 — enum 멤버는 싱글턴이므로 `is`로 비교
+# (dict 조회/`==` 대신 포인터 비교 한 번으로 플랫폼 코드 결정)
+_THREADS = Platform.THREADS
+_THREADS_CODE = PLATFORM_CODES[Platform.THREADS]
+_INSTAGRAM_CODE = PLATFORM_CODES[Platform.INSTAGRAM]
+
+# created_at → datetime64[us] 정수 변환 기준
+# (datetime 객체 리스트를 np.array로 변환하는 것보다 정수로 직접 채우는 편이 빠름)
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass(slots=True)
+class PostBatch:
+    """
+    게시물 리스트의 컬럼 배열 표현.
+
+    모든 배열은 posts와 같은 순서/길이를 갖습니다.
+
+    사용 예시:
+        batch = PostBatch.from_posts(posts)
+        ages = batch.ages_in_hours(datetime.now())
+    """
+    posts: list[SocialPost]          # 원본 게시물 (상위 게시물 반환용)
+    texts_lower: list[str]           # 소문자 게시물 텍스트 (키워드 검사용)
+    created_at: np.ndarray           # 작성 시각 (datetime64[us], naive)
+    platforms: np.ndarray            # 플랫폼 코드 (uint8, PLATFORM_CODES)
+    likes: np.ndarray                # 좋아요 수 (int64)
+    comments: np.ndarray             # 댓글 수 (int64)
+    views: np.ndarray                # 조회수 (int64)
+    engagement: np.ndarray           # 총 참여 수 (int64)
+    follower_counts: np.ndarray      # 팔로워 수 (int64, 정보 없으면 0)
+    sponsor_labels: np.ndarray       # 플랫폼 스폰서 표시 여부 (bool)
+    business_accounts: np.ndarray    # 비즈니스 계정 여부 (bool)
+
+    @classmethod
+    def from_posts(cls, posts: list[SocialPost]) -> PostBatch:
+        """게시물 리스트를 한 번 순회하여 컬럼 배열을 만듭니다."""
+        total = len(posts)
+        texts_lower: list[str] = []
+        created_at = np.empty(total, dtype=np.int64)
+        platforms = np.empty(total, dtype=np.uint8)
+        likes = np.empty(total, dtype=np.int64)
+        comments = np.empty(total, dtype=np.int64)
+        views = np.empty(total, dtype=np.int64)
+        engagement = np.empty(total, dtype=np.int64)
+        follower_counts = np.empty(total, dtype=np.int64)
+        sponsor_labels = np.empty(total, dtype=bool)
+        business_accounts = np.empty(total, dtype=bool)
+
+        for i, post in enumerate(posts):
+            metrics = post.engagement
+            texts_lower.append(post.text_lower)
+            # created_at이 timezone-aware일 수 있으므로 naive로 변환
+            created = post.created_at
+            if created.tzinfo is not None:
+                created = created.replace(tzinfo=None)
+            created_at[i] = (created - _EPOCH) // _MICROSECOND
+            platforms[i] = _THREADS_CODE if post.platform is _THREADS else _INSTAGRAM_CODE
+            likes[i] = metrics.likes
+            comments[i] = metrics.comments
+            views[i] = metrics.views
+            engagement[i] = metrics.total_engagement
+            follower_counts[i] = post.follower_count or 0
+            sponsor_labels[i] = post.has_sponsor_label
+            business_accounts[i] = post.is_business_account
+
+        return cls(
+            posts=posts,
+            texts_lower=texts_lower,
+            created_at=created_at.view("datetime64[us]"),
+            platforms=platforms,
+            likes=likes,
+            comments=comments,
+            views=views,
+            engagement=engagement,
+            follower_counts=follower_counts,
+            sponsor_labels=sponsor_labels,
+            business_accounts=business_accounts,
+        )
+
+    def __len__(self) -> int:
+        return len(self.posts)
+
+    def ages_in_hours(self, now: datetime) -> np.ndarray:
+        """기준 시각(now) 대비 게시물별 나이를 시간 단위(float64)로 반환합니다."""
+        reference = np.datetime64(now.replace(tzinfo=None), "us")
+        return (reference - self.created_at) / np.timedelta64(1, "h")
@@ -56,6 +56,14 @@ class Settings(BaseSettings):
         description="크로스 플랫폼 부스트 배율"
     )
 
+    # --- API 응답 캐시 ---
+    # 같은 URL+파라미터 GET 응답을 재사용할 시간 (초 단위)
+    # 예: 짧은 간격으로 같은 토픽을 다시 조회하면 네트워크 요청 없이 캐시 응답 사용
+    api_cache_expire_seconds: int = Field(
+        default=300,
+        description="API 응답 캐시 유지 시간 (초)"
+    )
+
     @property
     def is_demo_mode(self) -> bool:
         """
@@ -9,24 +9,30 @@ main.py — CLI 진입점
     python -m trend_analyzer "fashion" --limit 50 --export json
 """
 
-import json
+from __future__ import annotations
+
 import logging
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-from trend_analyzer.config import settings
-from trend_analyzer.models import Platform, SocialPost, TrendResult, PromotionLabel
-from trend_analyzer.scrapers.base import DemoScraper
-from trend_analyzer.scrapers.threads_scraper import ThreadsScraper
-from trend_analyzer.scrapers.instagram_scraper import InstagramScraper
-from trend_analyzer.analyzer.trend_detector import TrendDetector
+# rich, 설정, 스크래퍼, 분석기는 실제 실행 시점에 import합니다.
+# → `--help` 등 인자 처리만 할 때는 무거운 모듈 로딩 비용을 치르지 않도록
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from trend_analyzer.models import TrendResult
+
+
+@cache
+def _console() -> Console:
+    """rich 콘솔 (처음 사용할 때 한 번만 생성)."""
+    from rich.console import Console
+
+    return Console()
 
-console = Console()
 
 # 로깅 설정
 logging.basicConfig(
@@ -61,6 +67,17 @@ def cli(topic: str, limit: int, demo: bool, export: str | None):
 
     TOPIC: 분석할 키워드 또는 해시태그 (예: "AI", "fashion", "패션")
     """
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from trend_analyzer.analyzer.trend_detector import TrendDetector
+    from trend_analyzer.config import settings
+    from trend_analyzer.models import Platform, SocialPost
+    from trend_analyzer.scrapers.base import DemoScraper
+    from trend_analyzer.scrapers.instagram_scraper import InstagramScraper
+
+    console = _console()
+
     # 앱 배너 출력
     console.print()
     console.print(Panel.fit(
@@ -86,6 +103,7 @@ def cli(topic: str, limit: int, demo: bool, export: str | None):
         console=console,
     ) as progress:
         # [TODO] Threads API 수집 — 현재 API 권한 문제로 비활성화
+        # from trend_analyzer.scrapers.threads_scraper import ThreadsScraper
         # task1 = progress.add_task("📱 Threads 데이터 수집 중...", total=None)
         # if use_demo:
         #     threads_posts = DemoScraper(Platform.THREADS).search(topic, limit)
@@ -133,6 +151,12 @@ def cli(topic: str, limit: int, demo: bool, export: str | None):
 
 def _print_result(result: TrendResult, is_demo: bool):
     """트렌드 분석 결과를 테이블 형태로 출력합니다."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from trend_analyzer.models import Platform, PromotionLabel
+
+    console = _console()
 
     # --- 요약 패널 ---
     trend_emoji = {
@@ -246,7 +270,7 @@ def _print_result(result: TrendResult, is_demo: bool):
         for idx, post in enumerate(result.top_posts[:5], 1):
             # 텍스트를 40자로 제한
             short_text = post.text[:40] + "..." if len(post.text) > 40 else post.text
-            platform_icon = "📱" if post.platform == Platform.THREADS else "📸"
+            platform_icon = "📱" if post.platform is Platform.THREADS else "📸"
             top_table.add_row(
                 str(idx),
                 f"{platform_icon} {post.platform.value}",
@@ -273,6 +297,8 @@ def _score_bar(score: float, width: int = 20) -> str:
 
 def _export_json(result: TrendResult, topic: str) -> Path:
     """분석 결과를 JSON 파일로 내보냅니다."""
+    import orjson
+
     output_dir = Path("output")
     output_dir.mkdir(exist_ok=True)
 
@@ -282,14 +308,11 @@ def _export_json(result: TrendResult, topic: str) -> Path:
     filename = f"trend_{topic.replace(' ', '_')}_{timestamp}.json"
     output_path = output_dir / filename
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(
-            result.to_dict(),
-            f,
-            ensure_ascii=False,  # 한국어 유지
-            indent=2,
-            default=str,  # datetime 등 직렬화 불가 타입 처리
-        )
+    # orjson: C 구현 직렬화기, 항상 UTF-8로 출력 (한국어 유지)
+    # to_dict()가 이미 JSON 호환 값만 담고 있으므로 별도 default 처리 불필요
+    output_path.write_bytes(
+        orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2)
+    )
 
     return output_path
 
@@ -2,16 +2,18 @@
 models.py — 데이터 모델 정의
 
 역할: 앱 전체에서 사용되는 데이터 구조를 정의합니다.
-     Pydantic 모델로 타입 안전성과 자동 유효성 검증을 보장합니다.
+     분석 결과 모델은 Pydantic으로 타입 안전성과 자동 유효성 검증을 보장하고,
+     게시물 단위로 대량 생성되는 모델은 가벼운 slots dataclass로 정의합니다.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Platform(str, Enum):
@@ -40,10 +42,21 @@ class PromotionLabel(str, Enum):
     UNCERTAIN = "uncertain"
 
 
-class EngagementMetrics(BaseModel):
+# promotion_probability → PromotionLabel 판정 기준
+# (단일 게시물 판정과 일괄 판정이 같은 값을 쓰도록 한 곳에서 정의)
+PAID_THRESHOLD = 0.7      # 이 값 이상 → Paid
+ORGANIC_THRESHOLD = 0.3   # 이 값 이하 → Organic
+
+
+@dataclass(slots=True)
+class EngagementMetrics:
     """
     참여 지표.
     각 플랫폼에서 수집 가능한 참여 수치를 통합 모델로 관리합니다.
+
+    왜 Pydantic이 아닌 dataclass인가요?
+    → 게시물마다 생성되고 분석 루프에서 속성 접근이 매우 잦은 모델이라
+      slots 기반 dataclass로 속성 접근 비용과 메모리를 줄입니다.
     """
     likes: int = 0
     comments: int = 0
@@ -51,61 +64,66 @@ class EngagementMetrics(BaseModel):
     views: int = 0        # 조회수 (제공되는 경우)
     reposts: int = 0      # Threads 전용: 리포스트 수
 
+    # 총 참여 수 — 분석 중 여러 번 조회되므로 생성 시 한 번만 계산해 둡니다.
+    # (스크래퍼가 완성된 값으로 생성하므로 이후 재계산은 필요 없음)
+    _total: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._total = self.likes + self.comments + self.shares + self.views + self.reposts
+
     @property
     def total_engagement(self) -> int:
         """총 참여 수. 모든 지표의 합산."""
-        return self.likes + self.comments + self.shares + self.views + self.reposts
+        return self._total
 
 
-class SocialPost(BaseModel):
+@dataclass(slots=True)
+class SocialPost:
     """
     수집된 개별 소셜 미디어 게시물.
 
     Threads API와 Instagram Graph API에서 가져온 데이터를
     하나의 통합 구조로 변환하여 저장합니다.
+
+    EngagementMetrics와 같은 이유로 slots 기반 dataclass입니다.
+    (값은 스크래퍼의 매핑 코드에서 채워지므로 별도 유효성 검증은 하지 않습니다)
     """
-    post_id: str = Field(description="플랫폼 내 게시물 고유 ID")
-    platform: Platform = Field(description="출처 플랫폼")
-    author: str = Field(default="unknown", description="작성자 이름 또는 핸들")
-    text: str = Field(default="", description="게시물 텍스트 내용")
-    content_type: ContentType = Field(
-        default=ContentType.TEXT,
-        description="콘텐츠 유형"
-    )
-    engagement: EngagementMetrics = Field(
-        default_factory=EngagementMetrics,
-        description="참여 지표"
-    )
-    created_at: datetime = Field(
-        default_factory=datetime.now,
-        description="게시물 작성 시각"
-    )
-    hashtags: list[str] = Field(
-        default_factory=list,
-        description="게시물에 포함된 해시태그 목록"
-    )
-    url: str = Field(default="", description="게시물 원본 URL")
+    post_id: str                       # 플랫폼 내 게시물 고유 ID
+    platform: Platform                 # 출처 플랫폼
+    author: str = "unknown"            # 작성자 이름 또는 핸들
+    text: str = ""                     # 게시물 텍스트 내용
+    content_type: ContentType = ContentType.TEXT  # 콘텐츠 유형
+    engagement: EngagementMetrics = field(default_factory=EngagementMetrics)  # 참여 지표
+    created_at: datetime = field(default_factory=datetime.now)  # 게시물 작성 시각
+    hashtags: list[str] = field(default_factory=list)  # 게시물에 포함된 해시태그 목록
+    url: str = ""                      # 게시물 원본 URL
 
     # --- Promotion(광고) 감지용 힌트 필드 ---
-    is_business_account: bool = Field(
-        default=False,
-        description="비즈니스/크리에이터 계정 여부"
-    )
-    has_sponsor_label: bool = Field(
-        default=False,
-        description="플랫폼에서 스폰서 표시가 되어 있는지"
-    )
-    follower_count: Optional[int] = Field(
-        default=None,
-        description="작성자 팔로워 수 (알 수 있는 경우)"
-    )
+    is_business_account: bool = False  # 비즈니스/크리에이터 계정 여부
+    has_sponsor_label: bool = False    # 플랫폼에서 스폰서 표시가 되어 있는지
+    follower_count: Optional[int] = None  # 작성자 팔로워 수 (알 수 있는 경우)
+
+    # 소문자 텍스트 — 키워드 검사마다 .lower() 복사본을 만들지 않도록 생성 시 한 번만 계산
+    text_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # 검증은 하지 않지만 enum 필드는 문자열로 들어와도 멤버로 맞춰 둡니다.
+        # (분석 코드는 `is Platform.THREADS`처럼 멤버 identity로 비교하기 때문)
+        if type(self.platform) is not Platform:
+            self.platform = Platform(self.platform)
+        if type(self.content_type) is not ContentType:
+            self.content_type = ContentType(self.content_type)
+        self.text_lower = self.text.lower()
 
 
 class PromotionSignal(BaseModel):
     """
     Paid/Promoted 판단 근거.
     promotion_detector가 분석한 각 신호와 최종 확률을 담습니다.
+    판정 결과는 캐시되어 공유되므로 불변(frozen) 모델입니다.
     """
+    model_config = ConfigDict(frozen=True)
+
     keyword_detected: bool = Field(
         default=False,
         description="#ad, Sponsored 등 스폰서 키워드 발견 여부"
@@ -137,13 +155,13 @@ class PromotionSignal(BaseModel):
     def label(self) -> PromotionLabel:
         """
         확률 기반 판정.
-        - 0.7 이상 → Paid
-        - 0.3 미만 → Organic
+        - PAID_THRESHOLD(0.7) 이상 → Paid
+        - ORGANIC_THRESHOLD(0.3) 이하 → Organic
         - 그 사이 → Uncertain
         """
-        if self.promotion_probability >= 0.7:
+        if self.promotion_probability >= PAID_THRESHOLD:
             return PromotionLabel.PAID
-        elif self.promotion_probability <= 0.3:
+        elif self.promotion_probability <= ORGANIC_THRESHOLD:
             return PromotionLabel.ORGANIC
         return PromotionLabel.UNCERTAIN
 
@@ -228,5 +246,64 @@ class TrendResult(BaseModel):
         return "❄️ NO TREND"
 
     def to_dict(self) -> dict:
-        """JSON 내보내기용 딕셔너리 변환."""
-        return self.model_dump(mode="json")
+        """
+        JSON 내보내기용 딕셔너리 변환.
+
+        model_dump(mode="json")와 같은 구조를 직접 만듭니다.
+        (Pydantic 직렬화기를 거치지 않아 내보내기 경로가 가볍습니다)
+        """
+        return {
+            "topic": self.topic,
+            "velocity_score": self.velocity_score,
+            "volume_score": self.volume_score,
+            "amplification_score": self.amplification_score,
+            "trend_score": self.trend_score,
+            "total_posts": self.total_posts,
+            "threads_count": self.threads_count,
+            "instagram_count": self.instagram_count,
+            "is_cross_platform": self.is_cross_platform,
+            "organic_count": self.organic_count,
+            "paid_count": self.paid_count,
+            "uncertain_count": self.uncertain_count,
+            "dominant_promotion_label": self.dominant_promotion_label.value,
+            "organic_ratio": self.organic_ratio,
+            "top_posts": [_post_to_dict(post) for post in self.top_posts],
+        }
+
+
+def _isoformat(value: datetime) -> str:
+    """
+    datetime → ISO 문자열 (Pydantic JSON 직렬화와 같은 형식).
+
+    Pydantic은 UTC 시각을 "+00:00" 대신 "Z"로 씁니다.
+    API에서 가져온 게시물은 UTC timezone-aware이므로 같은 형식으로 맞춥니다.
+    """
+    text = value.isoformat()
+    if text.endswith("+00:00"):
+        return text[:-6] + "Z"
+    return text
+
+
+def _post_to_dict(post: SocialPost) -> dict:
+    """SocialPost → JSON 호환 딕셔너리 (enum은 값, datetime은 ISO 문자열)."""
+    engagement = post.engagement
+    return {
+        "post_id": post.post_id,
+        "platform": post.platform.value,
+        "author": post.author,
+        "text": post.text,
+        "content_type": post.content_type.value,
+        "engagement": {
+            "likes": engagement.likes,
+            "comments": engagement.comments,
+            "shares": engagement.shares,
+            "views": engagement.views,
+            "reposts": engagement.reposts,
+        },
+        "created_at": _isoformat(post.created_at),
+        "hashtags": list(post.hashtags),
+        "url": post.url,
+        "is_business_account": post.is_business_account,
+        "has_sponsor_label": post.has_sponsor_label,
+        "follower_count": post.follower_count,
+    }
@@ -1 +1,5 @@
 """스크래퍼 모듈 - Threads API / Instagram Graph API 데이터 수집."""
+
+from trend_analyzer.scrapers.base import BaseScraper, DemoScraper, gather_search
+
+__all__ = ["BaseScraper", "DemoScraper", "gather_search"]
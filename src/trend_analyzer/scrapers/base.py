@@ -10,14 +10,35 @@ base.py — 스크래퍼 추상 클래스 및 Demo 스크래퍼
   나중에 TikTok, X 등을 추가할 때도 같은 패턴으로 확장할 수 있습니다.
 """
 
+import asyncio
+import logging
+import re
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-import random
+
+import numpy as np
 
 from trend_analyzer.models import (
     SocialPost, Platform, ContentType, EngagementMetrics
 )
 
+logger = logging.getLogger(__name__)
+
+# 캡션/본문에서 스폰서 표시로 보는 키워드 (모든 플랫폼 스크래퍼 공통)
+# 키워드를 추가할 때는 이 목록만 수정하면 됩니다.
+SPONSOR_LABEL_KEYWORDS = ("#ad", "#sponsored", "paid partnership", "스폰서", "광고")
+
+# 키워드 목록 → 대소문자 무시 정규식 하나로 컴파일
+# (키워드 수가 늘어나도 게시물당 검색은 한 번)
+# 해시태그 키워드는 단어 경계까지 확인하여 "#adidas" 같은 태그는 제외
+SPONSOR_LABEL_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword) + (r"\b" if keyword.startswith("#") else "")
+        for keyword in SPONSOR_LABEL_KEYWORDS
+    ),
+    re.IGNORECASE,
+)
+
 
 class BaseScraper(ABC):
     """
@@ -39,6 +60,19 @@ class BaseScraper(ABC):
         """
         pass
 
+    async def search_async(self, topic: str, limit: int = 50) -> list[SocialPost]:
+        """
+        search()의 비동기 버전.
+
+        기본 구현은 search()를 워커 스레드에서 실행합니다.
+        (HTTP 대기 중에는 GIL이 풀리므로 여러 플랫폼/토픽 검색이 겹쳐서 진행됨)
+
+        왜 aiohttp로 다시 쓰지 않나요?
+        → 요청 수가 적고(페이지당 50~100건) 세션/에러 처리를
+          requests 기반 search()와 하나로 유지하는 편이 단순합니다.
+        """
+        return await asyncio.to_thread(self.search, topic, limit)
+
     @property
     @abstractmethod
     def platform_name(self) -> str:
@@ -46,6 +80,56 @@ class BaseScraper(ABC):
         pass
 
 
+async def gather_search(
+    scrapers: list[BaseScraper], topic: str, limit: int = 50
+) -> list[list[SocialPost]]:
+    """
+    여러 스크래퍼로 같은 토픽을 동시에 검색합니다.
+
+    전체 소요 시간이 플랫폼별 지연의 합이 아니라 가장 느린 플랫폼 기준이 됩니다.
+    한 플랫폼이 실패해도 나머지 결과는 유지합니다. (실패한 플랫폼은 빈 리스트)
+
+    Returns:
+        scrapers와 같은 순서의 게시물 리스트들
+    """
+    results = await asyncio.gather(
+        *(scraper.search_async(topic, limit) for scraper in scrapers),
+        return_exceptions=True,
+    )
+
+    gathered: list[list[SocialPost]] = []
+    for scraper, result in zip(scrapers, results):
+        if isinstance(result, Exception):
+            logger.error("%s 검색 실패: %s", scraper.platform_name, result)
+            gathered.append([])
+        elif isinstance(result, BaseException):
+            # 취소(CancelledError)·KeyboardInterrupt는 실패가 아니므로 그대로 전파
+            raise result
+        else:
+            gathered.append(result)
+    return gathered
+
+
+def drop_seen_items(items: list[dict], seen: set[str]) -> list[dict]:
+    """
+    API 응답 항목 중 이미 수집한 id를 제외하고, 새 id는 seen에 기록합니다.
+
+    왜 필요한가요?
+    → 페이지네이션 중 수정/재게시된 게시물이 여러 페이지에 다시 나올 수 있는데,
+      중복을 그대로 두면 트렌드 분석에서 별개 게시물로 집계됩니다.
+      (id가 없는 항목은 비교할 수 없으므로 그대로 유지)
+    """
+    fresh: list[dict] = []
+    for item in items:
+        item_id = item.get("id")
+        if item_id is not None:
+            if item_id in seen:
+                continue
+            seen.add(item_id)
+        fresh.append(item)
+    return fresh
+
+
 class DemoScraper(BaseScraper):
     """
     Demo 모드용 가짜 데이터 생성기.
@@ -67,8 +151,8 @@ class DemoScraper(BaseScraper):
         리얼한 샘플 데이터를 생성합니다.
         트렌딩 패턴(참여도 높은 게시물)과 일반 게시물을 섞어서 반환합니다.
         """
-        posts: list[SocialPost] = []
         now = datetime.now()
+        count = max(0, min(limit, 50))
 
         # 샘플 작성자 이름
         demo_authors = [
@@ -76,47 +160,93 @@ class DemoScraper(BaseScraper):
             "creator_studio", "brand_official", "news_hub",
             "lifestyle_mag", "data_nerd", "social_buzz", "casual_user"
         ]
+        sponsored_tags = ["#ad", "#sponsored", "Paid partnership"]
+        content_types = list(ContentType)
+
+        # 플랫폼은 루프 동안 바뀌지 않으므로 한 번만 비교
+        is_threads = self._platform is Platform.THREADS
+
+        # --- 난수를 게시물 수만큼 한 번에 뽑기 ---
+        # 왜? 게시물마다 random.* 를 10여 번 호출하는 대신
+        #     NumPy 배열 연산 몇 번으로 모든 게시물의 값을 만듭니다.
+        rng = np.random.default_rng()
+
+        # 일부 게시물은 트렌딩 패턴 (높은 참여도)
+        is_trending = rng.random(count) < 0.3
+        # 일부 게시물은 프로모션 패턴
+        is_promoted = rng.random(count) < 0.2
+
+        # 참여도: 트렌딩이면 높게, 일반이면 낮게
+        likes = np.where(
+            is_trending,
+            rng.integers(500, 10001, count),
+            rng.integers(5, 201, count),
+        )
+        comments = (likes * rng.uniform(0.02, 0.15, count)).astype(np.int64)
+        views = likes * rng.integers(5, 21, count)
+        # 상한이 게시물마다 다르므로 high에 배열을 전달
+        shares = rng.integers(0, likes // 5 + 1)
+        reposts = rng.integers(0, likes // 10 + 1) if is_threads else np.zeros(count, dtype=np.int64)
+
+        # 시간을 분산시켜 velocity 계산이 의미 있도록 (초 단위)
+        age_seconds = rng.uniform(0, 24, count) * 3600 + rng.integers(0, 60, count) * 60
+
+        is_business = is_promoted & (rng.random(count) < 0.7)
+        has_sponsor = is_promoted & (rng.random(count) < 0.5)
+        follower_counts = np.where(
+            is_promoted,
+            rng.integers(1000, 500001, count),
+            rng.integers(100, 50001, count),
+        )
+
+        author_idx = rng.integers(0, len(demo_authors), count)
+        content_idx = rng.integers(0, len(content_types), count)
+        sponsor_idx = rng.integers(0, len(sponsored_tags), count)
+
+        # 프로모션 게시물은 특유의 패턴 부여
+        topic_tag = f"#{topic.replace(' ', '')}"
+        base_text = f"{topic}에 대한 생각을 공유합니다 {topic_tag}"
+        texts = [
+            f"{base_text} {sponsored_tags[j]}" if promoted else base_text
+            for promoted, j in zip(is_promoted.tolist(), sponsor_idx.tolist())
+        ]
 
-        for i in range(min(limit, 50)):
-            # 일부 게시물은 트렌딩 패턴 (높은 참여도)
-            is_trending = random.random() < 0.3
-            # 일부 게시물은 프로모션 패턴
-            is_promoted = random.random() < 0.2
-
-            # 참여도: 트렌딩이면 높게, 일반이면 낮게
-            base_likes = random.randint(500, 10000) if is_trending else random.randint(5, 200)
-            base_comments = int(base_likes * random.uniform(0.02, 0.15))
-            base_views = base_likes * random.randint(5, 20)
+        # NumPy 스칼라가 모델에 섞이지 않도록 .tolist()로 파이썬 값으로 변환
+        rows = zip(
+            texts,
+            likes.tolist(), comments.tolist(), shares.tolist(),
+            views.tolist(), reposts.tolist(), age_seconds.tolist(),
+            author_idx.tolist(), content_idx.tolist(),
+            is_business.tolist(), has_sponsor.tolist(), follower_counts.tolist(),
+        )
 
-            # 프로모션 게시물은 특유의 패턴 부여
-            text_content = f"{topic}에 대한 생각을 공유합니다 #{topic.replace(' ', '')}"
-            if is_promoted:
-                sponsored_tags = ["#ad", "#sponsored", "Paid partnership"]
-                text_content += f" {random.choice(sponsored_tags)}"
+        # 게시물마다 바뀌지 않는 값은 루프 밖에서 한 번만 계산
+        platform = self._platform
+        id_prefix = f"demo_{platform.value}_"
 
+        posts: list[SocialPost] = []
+        for i, (
+            text, post_likes, post_comments, post_shares, post_views, post_reposts,
+            age, author, content, business, sponsor, followers,
+        ) in enumerate(rows):
             post = SocialPost(
-                post_id=f"demo_{self._platform.value}_{i:04d}",
-                platform=self._platform,
-                author=random.choice(demo_authors),
-                text=text_content,
-                content_type=random.choice(list(ContentType)),
+                post_id=f"{id_prefix}{i:04d}",
+                platform=platform,
+                author=demo_authors[author],
+                text=text,
+                content_type=content_types[content],
                 engagement=EngagementMetrics(
-                    likes=base_likes,
-                    comments=base_comments,
-                    shares=random.randint(0, base_likes // 5),
-                    views=base_views,
-                    reposts=random.randint(0, base_likes // 10)
-                    if self._platform == Platform.THREADS else 0,
-                ),
-                # 시간을 분산시켜 velocity 계산이 의미 있도록
-                created_at=now - timedelta(
-                    hours=random.uniform(0, 24),
-                    minutes=random.randint(0, 59)
+                    likes=post_likes,
+                    comments=post_comments,
+                    shares=post_shares,
+                    views=post_views,
+                    reposts=post_reposts,
                 ),
-                hashtags=[f"#{topic.replace(' ', '')}", f"#trending"],
-                is_business_account=is_promoted and random.random() < 0.7,
-                has_sponsor_label=is_promoted and random.random() < 0.5,
-                follower_count=random.randint(1000, 500000) if is_promoted else random.randint(100, 50000),
+                created_at=now - timedelta(seconds=age),
+                hashtags=[topic_tag, "#trending"],
+                is_business_account=business,
+                has_sponsor_label=sponsor,
+                follower_count=followers,
             )
             posts.append(post)
 
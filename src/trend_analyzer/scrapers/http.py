@@ -0,0 +1,93 @@
+"""
+http.py — 스크래퍼 공용 HTTP 세션 생성
+
+역할: 응답 캐시가 적용된 requests 세션을 만듭니다.
+
+왜 캐시를 쓰나요?
+→ 같은 토픽을 짧은 간격으로 다시 조회하면 (해시태그 ID 변환, 검색 결과)
+  동일한 GET 요청이 반복됩니다. 캐시된 응답을 쓰면 네트워크 왕복 자체가 사라지고
+  API 호출 한도(Threads: 7일간 500쿼리)도 아낄 수 있습니다.
+"""
+
+from functools import cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util import Retry
+
+from trend_analyzer.config import settings
+
+# 캐시 파일 저장 위치 (실행 디렉토리 기준)
+CACHE_DIR = ".cache"
+
+# 일시적 에러(레이트 리밋, 서버 에러) 재시도 정책
+# - 429는 Retry-After 헤더가 있으면 그 시간만큼 대기 후 재시도
+#   단, 최대 RETRY_AFTER_MAX초까지만 대기 (기본값 6시간이면 CLI가 사실상 멈춤)
+# - 그 외에는 지수 백오프 (0.5s → 1s → 2s ...) + 무작위 지터
+#   (동시에 실패한 요청들이 같은 시각에 다시 몰리지 않도록)
+# - 재시도를 모두 소진하면 마지막 응답을 그대로 반환 → raise_for_status()에서 처리
+RETRY_AFTER_MAX = 30
+RETRY_POLICY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    backoff_jitter=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+    retry_after_max=RETRY_AFTER_MAX,
+    raise_on_status=False,
+)
+
+# 커넥션 풀 크기
+# - POOL_CONNECTIONS: 호스트별 풀 개수 (graph.facebook.com, graph.threads.net, 페이지 URL 등)
+# - POOL_MAXSIZE: 호스트당 유지할 keep-alive 커넥션 수
+#   여러 토픽을 스레드로 동시에 검색해도 커넥션을 버리지 않고 재사용 (TLS 핸드셰이크 절약)
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 50
+
+
+def create_session(cache_name: str) -> requests.Session:
+    """
+    GET 응답을 SQLite에 캐시하는 세션을 만듭니다.
+
+    Args:
+        cache_name: 캐시 파일 이름 (예: "ig_api" → .cache/ig_api.sqlite)
+
+    429/5xx 응답은 RETRY_POLICY에 따라 자동으로 재시도합니다.
+
+    참고: access_token 파라미터는 requests-cache가 기본으로 캐시 키와
+    저장된 응답에서 제외하므로, 토큰이 캐시 파일에 남지 않습니다.
+    """
+    session = CachedSession(
+        cache_name=f"{CACHE_DIR}/{cache_name}",
+        backend="sqlite",
+        expire_after=settings.api_cache_expire_seconds,
+        allowable_methods=("GET",),
+        # 응답의 Cache-Control/Expires 헤더는 따르지 않음
+        # → Graph/Threads API는 모든 응답에 "no-store"와 과거 Expires를 보내므로
+        #   헤더를 따르면 아무것도 캐시되지 않습니다. 유지 시간은 위 설정값으로만 결정.
+        cache_control=False,
+    )
+    # 왜 바로 빈 결과로 처리하지 않나요?
+    # → 일시적 제한(429)을 실패로 끝내면 호출자가 처음부터 다시 요청해야 해서
+    #   API 호출 한도만 더 소모합니다.
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=RETRY_POLICY,
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+@cache
+def get_session(cache_name: str) -> requests.Session:
+    """
+    cache_name별로 하나만 만들어 공유하는 세션을 반환합니다.
+
+    왜 공유하나요?
+    → 스크래퍼 인스턴스는 요청마다 새로 만들어지는 경우가 많아(CLI, 테스트)
+      인스턴스별 세션이면 keep-alive 커넥션을 재사용할 기회가 없습니다.
+      access_token은 세션이 아닌 요청 파라미터로 전달하므로 공유해도 안전합니다.
+    """
+    return create_session(cache_name)
@@ -20,16 +20,24 @@ API 흐름 (2단계):
 
 import logging
 import re
-from datetime import datetime
-from typing import Optional
-
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Iterator, Optional
+
+import ciso8601
+import orjson
 import requests
 
 from trend_analyzer.config import settings
 from trend_analyzer.models import (
     SocialPost, Platform, ContentType, EngagementMetrics
 )
-from trend_analyzer.scrapers.base import BaseScraper, DemoScraper
+from trend_analyzer.scrapers.base import (
+    BaseScraper, DemoScraper, SPONSOR_LABEL_PATTERN, drop_seen_items
+)
+from trend_analyzer.scrapers.http import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +47,30 @@ IG_API_BASE = "https://graph.facebook.com/v21.0"
 # recent_media 엔드포인트에서 가져올 필드
 IG_MEDIA_FIELDS = "id,caption,timestamp,like_count,comments_count,media_type,permalink"
 
+# recent_media 페이지당 최대 건수 (API 한계)
+PAGE_SIZE = 50
+
+# API media_type → ContentType 매핑 (게시물마다 dict를 새로 만들지 않도록 모듈 상수)
+IG_MEDIA_TYPES = {
+    "IMAGE": ContentType.IMAGE,
+    "VIDEO": ContentType.VIDEO,
+    "CAROUSEL_ALBUM": ContentType.CAROUSEL,
+}
+
+# 해시태그 추출 정규식 (모듈 로드 시 한 번만 컴파일)
+_HASHTAG_RE = re.compile(r"#(\w+)")
+
+# 해시태그 ID 응답의 HTTP 캐시 유지 시간
+# 해시태그 → ID 매핑은 사실상 바뀌지 않으므로 검색 한도 기간(7일)만큼 재사용
+# (찾지 못한 응답은 캐시에서 바로 지움 → 나중에 생긴 해시태그도 다시 조회됨)
+HASHTAG_ID_CACHE_EXPIRE = timedelta(days=7)
+
+# 프로세스 내 해시태그 ID 캐시: (비즈니스 계정 ID, 정리된 토픽) → hashtag_id
+# 조회 결과가 계정별로 집계되므로 계정 ID도 키에 포함
+# 토픽은 사용자 입력이므로 최근 사용 순(LRU)으로 최대 HASHTAG_ID_CACHE_SIZE개만 유지
+HASHTAG_ID_CACHE_SIZE = 512
+_hashtag_ids: OrderedDict[tuple[str, str], str] = OrderedDict()
+
 
 class InstagramScraper(BaseScraper):
     """
@@ -67,7 +99,7 @@ class InstagramScraper(BaseScraper):
         """
         self._token = access_token or settings.meta_access_token
         self._account_id = business_account_id or settings.instagram_business_account_id
-        self._session = requests.Session()
+        self._session = get_session("ig_api")
 
     @property
     def platform_name(self) -> str:
@@ -87,17 +119,20 @@ class InstagramScraper(BaseScraper):
         if not self._token or not self._account_id:
             logger.warning("Instagram API 토큰/계정ID 없음 — Demo 모드로 전환")
             return DemoScraper(Platform.INSTAGRAM).search(topic, limit)
+        if limit <= 0:
+            # islice()는 음수 limit에 ValueError → API 호출 없이 바로 반환
+            return []
 
         try:
             # Step 1: 토픽 → 해시태그 ID 변환
             hashtag_id = self._get_hashtag_id(topic)
             if not hashtag_id:
-                logger.warning(f"'{topic}' 해시태그를 찾을 수 없음")
+                logger.warning("'%s' 해시태그를 찾을 수 없음", topic)
                 return []
 
             # Step 2: 해시태그 ID로 최근 미디어 조회
-            posts = self._get_recent_media(hashtag_id, limit)
-            logger.info(f"Instagram에서 '#{topic}' 관련 {len(posts)}건 수집 완료")
+            posts = list(islice(self._iter_recent_media(hashtag_id, limit), limit))
+            logger.info("Instagram에서 '#%s' 관련 %d건 수집 완료", topic, len(posts))
             return posts
         except requests.HTTPError as e:
             # Meta API는 JSON 응답에 상세 에러 정보를 포함함
@@ -115,7 +150,7 @@ class InstagramScraper(BaseScraper):
             except Exception:
                 error_detail = f"\n  → 응답 본문: {e.response.text[:500]}"
 
-            logger.error(f"Instagram API 에러: {e}{error_detail}")
+            logger.error("Instagram API 에러: %s%s", e, error_detail)
             return []
         except requests.ConnectionError:
             logger.error("Instagram API 연결 실패 — 네트워크 확인 필요")
@@ -128,11 +163,22 @@ class InstagramScraper(BaseScraper):
         왜 이 단계가 필요한가요?
         → Instagram API는 해시태그를 ID(숫자)로만 인식합니다.
           먼저 이름 → ID 매핑을 조회해야 합니다.
+
+        찾은 ID는 프로세스 내 캐시와 HTTP 캐시(7일)에 남겨
+        같은 토픽을 다시 검색할 때 이 요청 자체를 건너뜁니다.
+        (7일간 고유 해시태그 30개 검색 한도도 아낄 수 있음)
+        찾지 못한 결과는 어느 캐시에도 남기지 않습니다.
         """
         # 공백/특수문자 제거하여 해시태그 형식으로 변환
         # 예: "AI trends" → "aitrends"
         clean_topic = re.sub(r"[^a-zA-Z0-9가-힣]", "", topic).lower()
 
+        cache_key = (self._account_id, clean_topic)
+        cached_id = _hashtag_ids.get(cache_key)
+        if cached_id is not None:
+            _hashtag_ids.move_to_end(cache_key)
+            return cached_id
+
         params = {
             "q": clean_topic,
             "user_id": self._account_id,
@@ -143,52 +189,82 @@ class InstagramScraper(BaseScraper):
             f"{IG_API_BASE}/ig_hashtag_search",
             params=params,
             timeout=30,
+            expire_after=HASHTAG_ID_CACHE_EXPIRE,
         )
         response.raise_for_status()
 
-        data = response.json().get("data", [])
-        if not data:
+        data = orjson.loads(response.content).get("data", [])
+        hashtag_id = data[0].get("id") if data else None  # 첫 번째 결과의 ID
+
+        if not hashtag_id:
+            # 빈 응답이 7일간 캐시되면 그 사이 생긴 해시태그를 찾지 못하므로 삭제
+            self._session.cache.delete(requests=[response.request])
             return None
 
-        # 첫 번째 결과의 ID 반환
-        return data[0].get("id")
+        _hashtag_ids[cache_key] = hashtag_id
+        if len(_hashtag_ids) > HASHTAG_ID_CACHE_SIZE:
+            # 가장 오래 사용되지 않은 항목 제거
+            _hashtag_ids.popitem(last=False)
+        return hashtag_id
 
-    def _get_recent_media(self, hashtag_id: str, limit: int) -> list[SocialPost]:
+    def _iter_recent_media(self, hashtag_id: str, limit: int) -> Iterator[SocialPost]:
         """
-        해시태그 ID로 최근 24시간 내 미디어를 조회합니다.
+        해시태그 ID로 최근 24시간 내 미디어를 페이지 단위로 조회하며 하나씩 반환합니다.
 
         참고: Instagram API는 최대 250건의 최근 미디어를 반환합니다.
         Promoted/boosted 콘텐츠는 API 응답에서 자동 제외됩니다.
+
+        왜 제너레이터인가요?
+        → 전체 결과를 모아 두지 않고 한 페이지(최대 50건)씩만 메모리에 올립니다.
+          호출자가 필요한 만큼만 소비하면 다음 페이지 요청도 하지 않습니다.
         """
         params = {
             "user_id": self._account_id,
             "fields": IG_MEDIA_FIELDS,
-            "limit": min(limit, 50),  # 페이지당 최대 50건
+            "limit": min(limit, PAGE_SIZE),
             "access_token": self._token,
         }
 
-        all_posts: list[SocialPost] = []
+        collected = 0
+        seen: set[str] = set()  # 이미 반환한 미디어 id (페이지 간 중복 제거)
 
         # 페이지네이션: 원하는 수량만큼 수집
-        url = f"{IG_API_BASE}/{hashtag_id}/recent_media"
-        while url and len(all_posts) < limit:
-            response = self._session.get(url, params=params, timeout=30)
-            response.raise_for_status()
-
-            result = response.json()
-            media_items = result.get("data", [])
-
-            for item in media_items:
-                if len(all_posts) >= limit:
-                    break
-                all_posts.append(self._parse_media(item))
-
-            # 다음 페이지 URL (없으면 None → 루프 종료)
-            url = result.get("paging", {}).get("next")
-            # 다음 페이지 요청 시에는 params 불필요 (URL에 포함됨)
-            params = {}
-
-        return all_posts
+        # 현재 페이지를 처리하는 동안 다음 페이지를 백그라운드 스레드에서 미리 요청
+        # (응답 대기 중에는 GIL이 풀리므로 파싱/소비와 네트워크 대기가 겹침)
+        prefetcher = ThreadPoolExecutor(max_workers=1)
+        try:
+            pending = prefetcher.submit(
+                self._fetch_page, f"{IG_API_BASE}/{hashtag_id}/recent_media", params
+            )
+            while pending is not None:
+                result = pending.result()
+                media_items = drop_seen_items(result.get("data", []), seen)
+
+                # 남은 수량만큼 잘라서 처리 (항목마다 수량 비교하지 않음)
+                page = media_items[:limit - collected]
+                collected += len(page)
+
+                # 다음 페이지 URL (없으면 None → 루프 종료)
+                # 이번 페이지로 수량을 채우면 다음 페이지는 요청하지 않음
+                next_url = result.get("paging", {}).get("next")
+                if next_url and collected < limit:
+                    # 다음 페이지 요청 시에는 params 불필요 (URL에 포함됨)
+                    pending = prefetcher.submit(self._fetch_page, next_url, {})
+                else:
+                    pending = None
+
+                for item in page:
+                    yield self._parse_media(item)
+        finally:
+            # 호출자가 중간에 소비를 멈춰도 진행 중인 요청을 기다리지 않음
+            prefetcher.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_page(self, url: str, params: dict) -> dict:
+        """recent_media 한 페이지를 요청하고 JSON 응답을 파싱합니다."""
+        response = self._session.get(url, params=params, timeout=30)
+        response.raise_for_status()
+        # orjson: 표준 json보다 빠르게 파싱 (페이지당 최대 50건의 중첩 dict)
+        return orjson.loads(response.content)
 
     def _parse_media(self, raw: dict) -> SocialPost:
         """
@@ -203,29 +279,22 @@ class InstagramScraper(BaseScraper):
         - permalink → url
         """
         caption = raw.get("caption", "")
-        hashtags = re.findall(r"#(\w+)", caption)
+        hashtags = _HASHTAG_RE.findall(caption)
 
         # 미디어 타입 매핑
-        media_type_map = {
-            "IMAGE": ContentType.IMAGE,
-            "VIDEO": ContentType.VIDEO,
-            "CAROUSEL_ALBUM": ContentType.CAROUSEL,
-        }
-        content_type = media_type_map.get(
+        content_type = IG_MEDIA_TYPES.get(
             raw.get("media_type", "IMAGE"),
             ContentType.IMAGE
         )
 
         # 스폰서 키워드 감지
-        sponsor_keywords = ["#ad", "#sponsored", "paid partnership", "스폰서", "광고"]
-        has_sponsor = any(kw in caption.lower() for kw in sponsor_keywords)
+        has_sponsor = bool(SPONSOR_LABEL_PATTERN.search(caption))
 
         # 타임스탬프 파싱
+        # ciso8601: C 구현 ISO 8601 파서 — "Z"와 "+0000" 오프셋을 문자열 치환 없이 처리
         try:
-            created_at = datetime.fromisoformat(
-                raw.get("timestamp", "").replace("Z", "+00:00")
-            )
-        except (ValueError, AttributeError):
+            created_at = ciso8601.parse_datetime(raw.get("timestamp") or "")
+        except (ValueError, TypeError):
             created_at = datetime.now()
 
         return SocialPost(
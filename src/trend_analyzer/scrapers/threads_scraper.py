@@ -19,13 +19,18 @@ import re
 from datetime import datetime
 from typing import Optional
 
+import ciso8601
+import orjson
 import requests
 
 from trend_analyzer.config import settings
 from trend_analyzer.models import (
     SocialPost, Platform, ContentType, EngagementMetrics
 )
-from trend_analyzer.scrapers.base import BaseScraper, DemoScraper
+from trend_analyzer.scrapers.base import (
+    BaseScraper, DemoScraper, SPONSOR_LABEL_PATTERN, drop_seen_items
+)
+from trend_analyzer.scrapers.http import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +40,19 @@ THREADS_API_BASE = "https://graph.threads.net"
 # 검색 결과에서 가져올 필드 목록
 THREADS_FIELDS = "id,text,timestamp,like_count,reply_count,repost_count,views,username,media_type"
 
+# 검색 요청당 최대 건수 (API 한계)
+SEARCH_PAGE_SIZE = 100
+
+# API media_type → ContentType 매핑 (게시물마다 dict를 새로 만들지 않도록 모듈 상수)
+THREADS_MEDIA_TYPES = {
+    "TEXT_POST": ContentType.TEXT,
+    "IMAGE": ContentType.IMAGE,
+    "VIDEO": ContentType.VIDEO,
+}
+
+# 해시태그 추출 정규식 (모듈 로드 시 한 번만 컴파일)
+_HASHTAG_RE = re.compile(r"#(\w+)")
+
 
 class ThreadsScraper(BaseScraper):
     """
@@ -51,8 +69,8 @@ class ThreadsScraper(BaseScraper):
             access_token: Meta API 토큰. None이면 settings에서 가져옴.
         """
         self._token = access_token or settings.meta_access_token
-        # 세션 재사용으로 HTTP 커넥션 풀링 (성능 최적화)
-        self._session = requests.Session()
+        # 인스턴스 간 공유 세션으로 HTTP 커넥션 풀링 + 반복 조회 응답 캐시 (성능 최적화)
+        self._session = get_session("threads_api")
 
     @property
     def platform_name(self) -> str:
@@ -78,10 +96,10 @@ class ThreadsScraper(BaseScraper):
 
         try:
             posts = self._fetch_search_results(topic, limit)
-            logger.info(f"Threads에서 '{topic}' 관련 {len(posts)}건 수집 완료")
+            logger.info("Threads에서 '%s' 관련 %d건 수집 완료", topic, len(posts))
             return posts
         except requests.HTTPError as e:
-            logger.error(f"Threads API 에러: {e}")
+            logger.error("Threads API 에러: %s", e)
             # API 에러 시 빈 리스트 반환 (앱 전체가 죽지 않도록)
             return []
         except requests.ConnectionError:
@@ -99,7 +117,7 @@ class ThreadsScraper(BaseScraper):
             "q": topic,
             "search_type": "RECENT",
             "fields": THREADS_FIELDS,
-            "limit": min(limit, 100),  # API 한계 제한
+            "limit": min(limit, SEARCH_PAGE_SIZE),
             "access_token": self._token,
         }
 
@@ -111,8 +129,10 @@ class ThreadsScraper(BaseScraper):
         # HTTP 에러 시 예외 발생 (4xx, 5xx)
         response.raise_for_status()
 
-        data = response.json()
-        results = data.get("data", [])
+        # orjson: 표준 json보다 빠르게 파싱 (최대 100건의 중첩 dict)
+        data = orjson.loads(response.content)
+        # 같은 게시물이 중복으로 포함된 경우 한 번만 수집
+        results = drop_seen_items(data.get("data", []), set())
 
         return [self._parse_post(item) for item in results[:limit]]
 
@@ -130,29 +150,22 @@ class ThreadsScraper(BaseScraper):
         """
         # 텍스트에서 해시태그 추출
         text = raw.get("text", "")
-        hashtags = re.findall(r"#(\w+)", text)
+        hashtags = _HASHTAG_RE.findall(text)
 
         # 미디어 타입 매핑
-        media_type_map = {
-            "TEXT_POST": ContentType.TEXT,
-            "IMAGE": ContentType.IMAGE,
-            "VIDEO": ContentType.VIDEO,
-        }
-        content_type = media_type_map.get(
+        content_type = THREADS_MEDIA_TYPES.get(
             raw.get("media_type", "TEXT_POST"),
             ContentType.TEXT
         )
 
         # 스폰서 키워드 감지 (광고 구분용)
-        sponsor_keywords = ["#ad", "#sponsored", "paid partnership", "스폰서", "광고"]
-        has_sponsor = any(kw in text.lower() for kw in sponsor_keywords)
+        has_sponsor = bool(SPONSOR_LABEL_PATTERN.search(text))
 
         # 타임스탬프 파싱 — ISO 형식 또는 폴백
+        # ciso8601: C 구현 ISO 8601 파서 — "Z"와 "+0000" 오프셋을 문자열 치환 없이 처리
         try:
-            created_at = datetime.fromisoformat(
-                raw.get("timestamp", "").replace("Z", "+00:00")
-            )
-        except (ValueError, AttributeError):
+            created_at = ciso8601.parse_datetime(raw.get("timestamp") or "")
+        except (ValueError, TypeError):
             created_at = datetime.now()
 
         return SocialPost(
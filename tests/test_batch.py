@@ -0,0 +1,80 @@
+"""
+test_batch.py — 게시물 컬럼 배치 유닛 테스트
+
+검증 항목:
+    1. 게시물 → 컬럼 배열 변환
+    2. 기준 시각 대비 게시물 나이 계산
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from trend_analyzer.models import SocialPost, Platform, EngagementMetrics
+from trend_analyzer.batch import PLATFORM_CODES, PostBatch
+
+
+def _make_post(
+    platform: Platform = Platform.THREADS,
+    likes: int = 100,
+    follower_count: int | None = None,
+    created_at: datetime | None = None,
+) -> SocialPost:
+    """테스트용 게시물 생성 헬퍼."""
+    return SocialPost(
+        post_id=f"test_{platform.value}_{likes}",
+        platform=platform,
+        text=f"게시물 {likes}",
+        engagement=EngagementMetrics(likes=likes, comments=10, views=1000),
+        created_at=created_at or datetime.now(),
+        follower_count=follower_count,
+    )
+
+
+class TestFromPosts:
+    """게시물 → 컬럼 배열 변환 테스트."""
+
+    def test_필드별_배열_생성(self):
+        """각 컬럼은 게시물 순서대로 값을 담아야 함."""
+        posts = [
+            _make_post(platform=Platform.THREADS, likes=100, follower_count=5000),
+            _make_post(platform=Platform.INSTAGRAM, likes=300),
+        ]
+        batch = PostBatch.from_posts(posts)
+        assert len(batch) == 2
+        assert batch.texts_lower == ["게시물 100", "게시물 300"]
+        assert batch.platforms.tolist() == [
+            PLATFORM_CODES[Platform.THREADS],
+            PLATFORM_CODES[Platform.INSTAGRAM],
+        ]
+        assert batch.likes.tolist() == [100, 300]
+        assert batch.engagement.tolist() == [1110, 1310]
+
+    def test_문자열_플랫폼도_같은_코드(self):
+        """platform을 문자열로 만든 게시물도 올바른 플랫폼 코드로 변환."""
+        posts = [
+            SocialPost(post_id="1", platform="threads"),
+            SocialPost(post_id="2", platform="instagram"),
+        ]
+        batch = PostBatch.from_posts(posts)
+        assert batch.platforms.tolist() == [
+            PLATFORM_CODES[Platform.THREADS],
+            PLATFORM_CODES[Platform.INSTAGRAM],
+        ]
+
+    def test_팔로워_정보_없으면_0(self):
+        """follower_count가 None이면 0으로 저장."""
+        batch = PostBatch.from_posts([_make_post(follower_count=None)])
+        assert batch.follower_counts.tolist() == [0]
+
+
+class TestAges:
+    """게시물 나이 계산 테스트."""
+
+    def test_기준_시각_대비_시간_단위(self):
+        """timezone-aware 시각도 naive로 변환하여 시간 단위 나이를 계산."""
+        now = datetime(2025, 1, 1, 12, 0)
+        posts = [
+            _make_post(created_at=now - timedelta(hours=2)),
+            _make_post(created_at=(now - timedelta(minutes=30)).replace(tzinfo=timezone.utc)),
+        ]
+        ages = PostBatch.from_posts(posts).ages_in_hours(now)
+        assert ages.tolist() == [2.0, 0.5]
@@ -0,0 +1,103 @@
+"""
+test_models.py — 데이터 모델 유닛 테스트
+
+검증 항목:
+    1. TrendResult JSON 내보내기 변환
+    2. SocialPost 소문자 텍스트 캐시
+    3. 분석 결과 모델 유효성 검증
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from trend_analyzer.models import (
+    SocialPost, Platform, EngagementMetrics, ContentType, TrendResult, PromotionLabel,
+    PromotionSignal,
+)
+
+
+def _make_post(likes: int = 100, created_at: datetime = datetime(2025, 1, 1, 12, 30)) -> SocialPost:
+    """테스트용 게시물 생성 헬퍼."""
+    return SocialPost(
+        post_id=f"test_{likes}",
+        platform=Platform.INSTAGRAM,
+        author="test_user",
+        text="테스트 게시물 #광고",
+        content_type=ContentType.IMAGE,
+        engagement=EngagementMetrics(likes=likes, comments=10, views=1000),
+        created_at=created_at,
+        hashtags=["광고"],
+        follower_count=5000,
+    )
+
+
+class TestToDict:
+    """JSON 내보내기 변환 테스트."""
+
+    def test_pydantic_직렬화와_같은_결과(self):
+        """to_dict는 model_dump(mode="json")과 같은 딕셔너리를 반환해야 함."""
+        result = TrendResult(
+            topic="test",
+            trend_score=55.5,
+            total_posts=2,
+            instagram_count=2,
+            dominant_promotion_label=PromotionLabel.UNCERTAIN,
+            top_posts=[
+                _make_post(likes=300),
+                # API 게시물은 timezone-aware (UTC 및 다른 오프셋)
+                _make_post(likes=200, created_at=datetime(2025, 1, 1, 9, 30, 0, 120, tzinfo=timezone.utc)),
+                _make_post(likes=100, created_at=datetime(2025, 1, 1, 9, 30, tzinfo=timezone(timedelta(hours=9)))),
+            ],
+        )
+        assert result.to_dict() == result.model_dump(mode="json")
+
+    def test_게시물_필드는_JSON_호환_값(self):
+        """enum은 문자열 값, datetime은 ISO 문자열로 변환."""
+        result = TrendResult(topic="test", top_posts=[_make_post()])
+        post = result.to_dict()["top_posts"][0]
+        assert post["platform"] == "instagram"
+        assert post["content_type"] == "image"
+        assert post["created_at"] == "2025-01-01T12:30:00"
+
+    def test_UTC_시각은_Z_표기(self):
+        """timezone-aware UTC 시각은 Pydantic과 같이 "Z"로 끝남."""
+        created_at = datetime(2025, 1, 1, 9, 30, tzinfo=timezone.utc)
+        result = TrendResult(topic="test", top_posts=[_make_post(created_at=created_at)])
+        assert result.to_dict()["top_posts"][0]["created_at"] == "2025-01-01T09:30:00Z"
+
+
+class TestSocialPost:
+    """게시물 모델 테스트."""
+
+    def test_소문자_텍스트는_생성_시_계산(self):
+        """text_lower는 생성 시 한 번 계산되고 비교/출력에는 포함되지 않음."""
+        post = SocialPost(post_id="1", platform=Platform.THREADS, text="Paid Partnership #AD")
+        assert post.text_lower == "paid partnership #ad"
+        assert "text_lower" not in repr(post)
+
+    def test_문자열_enum_값은_멤버로_변환(self):
+        """platform/content_type을 문자열로 넘겨도 enum 멤버로 저장."""
+        post = SocialPost(post_id="1", platform="threads", content_type="video")
+        assert post.platform is Platform.THREADS
+        assert post.content_type is ContentType.VIDEO
+
+
+class TestValidation:
+    """
+    Pydantic 결과 모델 유효성 검증 스모크 테스트.
+
+    게시물 모델(SocialPost, EngagementMetrics)은 검증 없는 dataclass이므로
+    스키마 검증은 분석 결과 모델에서만 확인합니다.
+    """
+
+    def test_점수_범위_벗어나면_에러(self):
+        """trend_score는 0~100 범위만 허용."""
+        with pytest.raises(ValidationError):
+            TrendResult(topic="test", trend_score=150.0)
+
+    def test_확률_범위_벗어나면_에러(self):
+        """promotion_probability는 0~1 범위만 허용."""
+        with pytest.raises(ValidationError):
+            PromotionSignal(promotion_probability=1.5)
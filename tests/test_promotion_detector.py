@@ -14,7 +14,11 @@ import pytest
 from trend_analyzer.models import (
     SocialPost, Platform, EngagementMetrics, ContentType, PromotionLabel
 )
-from trend_analyzer.analyzer.promotion_detector import PromotionDetector
+from trend_analyzer.analyzer.promotion_detector import (
+    PromotionDetector,
+    _contains_sponsor_keyword,
+)
+from trend_analyzer.batch import PostBatch
 
 
 def _make_post(
@@ -82,6 +86,20 @@ class TestSponsorKeywordDetection:
         signal = detector.detect(post)
         assert signal.keyword_detected is False
 
+    def test_해시태그_일부만_일치하면_미감지(self):
+        """#adidas처럼 키워드로 시작하는 다른 해시태그 → keyword_detected = False."""
+        detector = PromotionDetector()
+        post = _make_post(text="새 운동화 #adidas #sponsoredby")
+        signal = detector.detect(post)
+        assert signal.keyword_detected is False
+
+    def test_줄바꿈_뒤_해시태그_감지(self):
+        """줄바꿈/탭으로 구분된 #ad도 독립 해시태그로 감지."""
+        detector = PromotionDetector()
+        post = _make_post(text="새 제품 출시\n#AD\t#beauty")
+        signal = detector.detect(post)
+        assert signal.keyword_detected is True
+
 
 class TestEngagementAnomaly:
     """참여율 이상 감지 테스트."""
@@ -179,3 +197,42 @@ class TestOverallClassification:
         # 비즈니스(0.10) + 참여이상(0.15) = 0.25 → Organic
         # 하지만 정확한 값은 구현에 따라 다를 수 있음
         assert 0.0 <= signal.promotion_probability <= 1.0
+
+
+class TestSponsorKeywordCache:
+    """스폰서 키워드 검사 캐시 테스트."""
+
+    def test_일괄_판정도_캐시_사용(self):
+        """detect_batch에서 같은 본문이 반복되면 키워드 검사를 다시 하지 않음."""
+        _contains_sponsor_keyword.cache_clear()
+        posts = [_make_post(text="추천 #ad"), _make_post(text="추천 #ad")]
+        PromotionDetector().detect_batch(PostBatch.from_posts(posts))
+        info = _contains_sponsor_keyword.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_참여_수치가_바뀌면_다시_계산(self):
+        """본문이 같아도 판정에 쓰이는 값이 다르면 결과가 달라짐."""
+        detector = PromotionDetector()
+        normal = detector.detect(_make_post(likes=100, follower_count=10000))
+        anomaly = detector.detect(_make_post(likes=2000, follower_count=10000))
+        assert normal.engagement_anomaly is False
+        assert anomaly.engagement_anomaly is True
+
+
+class TestDetectBatch:
+    """일괄 판정 테스트."""
+
+    def test_단건_판정과_같은_확률(self):
+        """detect_batch 결과는 게시물별 detect 결과와 일치해야 함."""
+        detector = PromotionDetector()
+        posts = [
+            _make_post(text="최고의 제품! #ad #sponsored", is_business=True, has_sponsor=True),
+            _make_post(likes=200, follower_count=1000),
+            _make_post(likes=100, views=1000000, comments=5),
+            _make_post(likes=500, comments=0, views=0),
+            _make_post(text="Paid partnership with BrandX", follower_count=0),
+            _make_post(text="오늘 맛집 발견! #먹스타그램", likes=30, views=300, follower_count=5000),
+        ]
+        probabilities = detector.detect_batch(PostBatch.from_posts(posts))
+        expected = [detector.detect(p).promotion_probability for p in posts]
+        assert probabilities.tolist() == expected
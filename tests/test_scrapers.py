@@ -0,0 +1,345 @@
+"""
+test_scrapers.py — 스크래퍼 유닛 테스트
+
+검증 항목:
+    1. Demo 스크래퍼 샘플 데이터 생성
+    2. 여러 플랫폼 동시 검색 (gather_search)
+    3. API 응답 파싱 (해시태그, 스폰서 키워드)
+    4. HTTP 세션 설정 (재시도 정책)
+    5. Instagram 페이지네이션 / Threads 검색 중복 제거
+    6. 해시태그 ID 캐시
+"""
+
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+from requests import Response
+from requests.adapters import BaseAdapter
+from urllib3 import HTTPResponse
+
+from trend_analyzer.models import Platform, SocialPost
+from trend_analyzer.scrapers import BaseScraper, DemoScraper, gather_search
+from trend_analyzer.scrapers.http import create_session, get_session
+from trend_analyzer.scrapers import instagram_scraper
+from trend_analyzer.scrapers.instagram_scraper import InstagramScraper
+from trend_analyzer.scrapers.threads_scraper import ThreadsScraper
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """응답 캐시 파일(.cache/)이 저장소가 아닌 임시 디렉토리에 생기도록."""
+    monkeypatch.chdir(tmp_path)
+
+
+class _FailingScraper(BaseScraper):
+    """항상 예외를 던지는 테스트용 스크래퍼."""
+
+    @property
+    def platform_name(self) -> str:
+        return "Failing"
+
+    def search(self, topic: str, limit: int = 50) -> list[SocialPost]:
+        raise RuntimeError("API 장애")
+
+
+class TestDemoScraper:
+    """Demo 샘플 데이터 생성 테스트."""
+
+    def test_모델_필드는_파이썬_기본_타입(self):
+        """NumPy로 생성한 값도 JSON 내보내기를 위해 int/bool로 변환되어야 함."""
+        posts = DemoScraper(Platform.THREADS).search("AI", limit=20)
+        assert len(posts) == 20
+        for post in posts:
+            assert type(post.engagement.likes) is int
+            assert type(post.follower_count) is int
+            assert type(post.has_sponsor_label) is bool
+
+    def test_음수_limit은_빈_결과(self):
+        """--limit -1 같은 입력에도 예외 없이 빈 목록을 반환해야 함."""
+        assert DemoScraper(Platform.INSTAGRAM).search("AI", limit=-1) == []
+
+
+class _FakeResponse:
+    """requests.Response 대용 (content + raise_for_status만 사용)."""
+
+    def __init__(self, payload: dict):
+        self.content = orjson.dumps(payload)
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _FakeSession:
+    """URL별로 미리 정한 응답을 돌려주고 요청한 URL을 기록하는 세션."""
+
+    def __init__(self, pages: dict[str, dict]):
+        self._pages = pages
+        self.requested: list[str] = []
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        self.requested.append(url)
+        return _FakeResponse(self._pages[url])
+
+
+class _CancelledScraper(BaseScraper):
+    """검색 도중 취소되는 테스트용 스크래퍼."""
+
+    @property
+    def platform_name(self) -> str:
+        return "Cancelled"
+
+    def search(self, topic: str, limit: int = 50) -> list[SocialPost]:
+        return []
+
+    async def search_async(self, topic: str, limit: int = 50) -> list[SocialPost]:
+        raise asyncio.CancelledError
+
+
+# 실제 Graph/Threads API 응답의 캐시 관련 헤더
+GRAPH_API_HEADERS = {
+    "Cache-Control": "private, no-cache, no-store, must-revalidate",
+    "Expires": "Sat, 01 Jan 2000 00:00:00 GMT",
+    "Pragma": "no-cache",
+}
+
+
+class _QueuedAdapter(BaseAdapter):
+    """
+    실제 네트워크 대신 미리 정한 JSON 응답을 순서대로 돌려주는 어댑터.
+    캐시 세션(CachedSession)의 동작까지 함께 확인할 때 사용합니다.
+    """
+
+    def __init__(self, payloads: list[dict], headers: dict[str, str] | None = None):
+        super().__init__()
+        self._payloads = list(payloads)
+        self._headers = headers or {}
+        self.sent = 0
+
+    def send(self, request, **kwargs):
+        self.sent += 1
+        body = orjson.dumps(self._payloads.pop(0))
+        response = Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response.headers.update(self._headers)
+        response.raw = HTTPResponse(
+            body=body, status=200, headers=response.headers, request_url=request.url
+        )
+        response._content = body
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class TestGatherSearch:
+    """여러 플랫폼 동시 검색 테스트."""
+
+    def test_스크래퍼_순서대로_결과_반환(self):
+        """결과는 전달한 스크래퍼 순서와 같아야 함."""
+        scrapers = [DemoScraper(Platform.THREADS), DemoScraper(Platform.INSTAGRAM)]
+        threads_posts, instagram_posts = asyncio.run(gather_search(scrapers, "AI", 10))
+        assert len(threads_posts) == 10
+        assert all(p.platform == Platform.THREADS for p in threads_posts)
+        assert all(p.platform == Platform.INSTAGRAM for p in instagram_posts)
+
+    def test_한_플랫폼_실패해도_나머지_유지(self):
+        """실패한 플랫폼은 빈 리스트, 나머지는 정상 결과."""
+        scrapers = [_FailingScraper(), DemoScraper(Platform.INSTAGRAM)]
+        failed, instagram_posts = asyncio.run(gather_search(scrapers, "AI", 5))
+        assert failed == []
+        assert len(instagram_posts) == 5
+
+    def test_취소는_빈_결과로_바꾸지_않음(self):
+        """CancelledError는 삼키지 않고 호출자에게 전파."""
+        scrapers = [_CancelledScraper(), DemoScraper(Platform.INSTAGRAM)]
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(gather_search(scrapers, "AI", 5))
+
+
+class TestParsePost:
+    """Threads API 응답 파싱 테스트."""
+
+    def test_해시태그와_스폰서_키워드_추출(self):
+        """#ad 포함 텍스트 → 해시태그 추출 + has_sponsor_label = True."""
+        post = ThreadsScraper(access_token="test")._parse_post(
+            {"id": 1, "text": "신제품 리뷰 #AD #beauty", "timestamp": "2025-01-01T00:00:00Z"}
+        )
+        assert post.hashtags == ["AD", "beauty"]
+        assert post.has_sponsor_label is True
+
+    def test_ad로_시작하는_다른_해시태그는_미감지(self):
+        """#adidas는 스폰서 키워드가 아님."""
+        post = ThreadsScraper(access_token="test")._parse_post({"id": 2, "text": "새 운동화 #adidas"})
+        assert post.has_sponsor_label is False
+
+    def test_타임스탬프_파싱(self):
+        """Graph API의 "+0000" 오프셋 형식도 timezone-aware로 파싱."""
+        post = ThreadsScraper(access_token="test")._parse_post(
+            {"id": 3, "timestamp": "2025-01-01T09:30:00+0000"}
+        )
+        assert post.created_at == datetime(2025, 1, 1, 9, 30, tzinfo=timezone.utc)
+
+
+class TestHttpSession:
+    """공용 HTTP 세션 설정 테스트."""
+
+    def test_no_store_응답도_캐시(self):
+        """Graph API처럼 no-store/과거 Expires를 보내도 같은 GET은 캐시에서 응답."""
+        session = create_session("cache_header_test")
+        adapter = _QueuedAdapter([{"data": []}], headers=GRAPH_API_HEADERS)
+        session.mount("https://", adapter)
+
+        url = "https://graph.threads.net/search?q=AI"
+        assert session.get(url).from_cache is False
+        assert session.get(url).from_cache is True
+        assert adapter.sent == 1
+
+    def test_레이트_리밋_응답은_재시도(self):
+        """429 응답은 Retry-After를 따라 재시도하도록 설정되어야 함."""
+        retries = create_session("test_api").get_adapter("https://graph.threads.net").max_retries
+        assert 429 in retries.status_forcelist
+        assert retries.respect_retry_after_header is True
+        assert retries.total == 5
+
+    def test_재시도_대기_시간_상한과_지터(self):
+        """Retry-After 대기는 수십 초로 제한하고, 백오프에는 지터를 적용."""
+        retries = create_session("test_api").get_adapter("https://graph.threads.net").max_retries
+        assert retries.retry_after_max <= 60
+        assert retries.backoff_jitter > 0
+
+    def test_동시_검색용_커넥션_풀(self):
+        """호스트당 커넥션 풀은 기본값(10)보다 크게 설정되어야 함."""
+        adapter = create_session("test_api").get_adapter("https://graph.facebook.com")
+        assert adapter._pool_maxsize == 50
+
+    def test_스크래퍼_인스턴스간_세션_공유(self):
+        """같은 플랫폼 스크래퍼는 새로 만들어도 같은 세션(커넥션 풀)을 사용."""
+        first = ThreadsScraper(access_token="token_a")
+        second = ThreadsScraper(access_token="token_b")
+        assert first._session is second._session
+        assert first._session is get_session("threads_api")
+
+
+class TestInstagramPagination:
+    """Instagram recent_media 페이지네이션 테스트."""
+
+    def _scraper(self, session: _FakeSession) -> InstagramScraper:
+        scraper = InstagramScraper(access_token="test", business_account_id="1")
+        scraper._session = session
+        return scraper
+
+    def test_필요한_만큼만_페이지_요청(self):
+        """첫 페이지에서 limit을 채우면 다음 페이지는 요청하지 않음."""
+        first = "https://graph.facebook.com/v21.0/42/recent_media"
+        session = _FakeSession({
+            first: {
+                "data": [{"id": i, "caption": f"post {i}"} for i in range(3)],
+                "paging": {"next": "page2"},
+            },
+        })
+        posts = list(self._scraper(session)._iter_recent_media("42", limit=2))
+        assert [p.post_id for p in posts] == ["0", "1"]
+        assert session.requested == [first]
+
+    def test_여러_페이지에_걸쳐_수집(self):
+        """다음 페이지 URL을 따라가며 limit까지 수집."""
+        first = "https://graph.facebook.com/v21.0/42/recent_media"
+        session = _FakeSession({
+            first: {"data": [{"id": 0}, {"id": 1}], "paging": {"next": "page2"}},
+            "page2": {"data": [{"id": 2}, {"id": 3}]},
+        })
+        posts = list(self._scraper(session)._iter_recent_media("42", limit=3))
+        assert [p.post_id for p in posts] == ["0", "1", "2"]
+        assert session.requested == [first, "page2"]
+
+    def test_음수_limit은_요청_없이_빈_결과(self):
+        """limit이 0 이하이면 API를 호출하지 않고 빈 목록 반환."""
+        session = _FakeSession({})
+        assert self._scraper(session).search("AI", limit=-1) == []
+        assert session.requested == []
+
+    def test_페이지_간_중복_게시물_제거(self):
+        """다음 페이지에 다시 나온 미디어는 한 번만 수집."""
+        first = "https://graph.facebook.com/v21.0/42/recent_media"
+        session = _FakeSession({
+            first: {"data": [{"id": 0}, {"id": 1}], "paging": {"next": "page2"}},
+            "page2": {"data": [{"id": 1}, {"id": 2}, {"id": 3}]},
+        })
+        posts = list(self._scraper(session)._iter_recent_media("42", limit=3))
+        assert [p.post_id for p in posts] == ["0", "1", "2"]
+
+
+class TestThreadsSearch:
+    """Threads 검색 결과 처리 테스트."""
+
+    def test_중복_게시물_제거(self):
+        """검색 응답에 같은 id가 여러 번 있으면 한 번만 수집."""
+        url = "https://graph.threads.net/search"
+        session = _FakeSession({
+            url: {"data": [{"id": "a"}, {"id": "b"}, {"id": "a"}, {"id": "c"}]},
+        })
+        scraper = ThreadsScraper(access_token="test")
+        scraper._session = session
+        posts = scraper._fetch_search_results("AI", limit=10)
+        assert [p.post_id for p in posts] == ["a", "b", "c"]
+
+
+class TestHashtagIdCache:
+    """해시태그 ID 캐시 테스트."""
+
+    def test_같은_토픽은_다시_요청하지_않음(self):
+        """한 번 찾은 해시태그 ID는 새 스크래퍼 인스턴스에서도 재사용."""
+        url = "https://graph.facebook.com/v21.0/ig_hashtag_search"
+        session = _FakeSession({url: {"data": [{"id": "17843"}]}})
+
+        first = InstagramScraper(access_token="test", business_account_id="cache_test")
+        first._session = session
+        assert first._get_hashtag_id("AI Trends") == "17843"
+
+        second = InstagramScraper(access_token="test", business_account_id="cache_test")
+        second._session = session
+        assert second._get_hashtag_id("ai trends!") == "17843"
+        assert session.requested == [url]
+
+    def test_찾지_못한_토픽은_캐시하지_않음(self):
+        """해시태그가 없던 토픽도 다시 검색하면 새로 생긴 ID를 찾아야 함."""
+        session = create_session("hashtag_test")
+        adapter = _QueuedAdapter(
+            [{"data": []}, {"data": [{"id": "17999"}]}], headers=GRAPH_API_HEADERS
+        )
+        session.mount("https://", adapter)
+
+        scraper = InstagramScraper(access_token="test", business_account_id="miss_test")
+        scraper._session = session
+        assert scraper._get_hashtag_id("새토픽") is None
+        assert scraper._get_hashtag_id("새토픽") == "17999"
+        assert adapter.sent == 2
+
+        # 찾은 ID는 HTTP 캐시에도 남아 네트워크 요청 없이 재사용
+        cached = session.get(
+            "https://graph.facebook.com/v21.0/ig_hashtag_search",
+            params={"q": "새토픽", "user_id": "miss_test", "access_token": "test"},
+        )
+        assert cached.from_cache is True
+        assert adapter.sent == 2
+
+    def test_캐시는_최근_사용_순으로_크기_제한(self, monkeypatch):
+        """크기를 넘으면 가장 오래 쓰지 않은 토픽부터 제거."""
+        monkeypatch.setattr(instagram_scraper, "HASHTAG_ID_CACHE_SIZE", 2)
+        monkeypatch.setattr(instagram_scraper, "_hashtag_ids", OrderedDict())
+        url = "https://graph.facebook.com/v21.0/ig_hashtag_search"
+        session = _FakeSession({url: {"data": [{"id": "1"}]}})
+        scraper = InstagramScraper(access_token="test", business_account_id="lru_test")
+        scraper._session = session
+
+        for topic in ("a", "b", "a", "c"):  # "a"를 다시 써서 "b"가 가장 오래됨
+            scraper._get_hashtag_id(topic)
+
+        assert list(instagram_scraper._hashtag_ids) == [("lru_test", "a"), ("lru_test", "c")]
+        assert len(session.requested) == 3
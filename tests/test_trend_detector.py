@@ -9,14 +9,16 @@ test_trend_detector.py — 트렌드 감지 엔진 유닛 테스트
     5. 빈 데이터 처리
 """
 
+import math
 from datetime import datetime, timedelta
 
 import pytest
 
 from trend_analyzer.models import (
-    SocialPost, Platform, EngagementMetrics, ContentType
+    SocialPost, Platform, EngagementMetrics, ContentType, PromotionLabel
 )
 from trend_analyzer.analyzer.trend_detector import TrendDetector
+from trend_analyzer.batch import PostBatch
 
 
 def _make_post(
@@ -72,6 +74,17 @@ class TestVelocityScore:
         result = detector.analyze("test", [])
         assert result.velocity_score == 0.0
 
+    def test_기준_시각을_고정하면_결정적(self):
+        """now를 지정하면 그 시각 기준으로 게시물 나이를 계산."""
+        detector = TrendDetector(velocity_window_hours=6)
+        now = datetime(2025, 1, 1, 12, 0)
+        post = _make_post(likes=100, comments=10, views=1000)
+        post.created_at = now - timedelta(hours=1)
+        result = detector.analyze("test", [post], now=now)
+        # 1시간 전 게시물: 참여 1110 × 가중치 e^(-0.3)
+        expected = math.log1p(1110 * math.exp(-0.3)) / math.log1p(1000) * 100
+        assert result.velocity_score == round(expected, 1)
+
 
 class TestVolumeScore:
     """Volume Score 계산 테스트."""
@@ -161,3 +174,51 @@ class TestTrendScore:
         assert result.trend_score == 0.0
         assert result.total_posts == 0
         assert "NO TREND" in result.trend_level
+
+
+class TestTopPosts:
+    """상위 참여 게시물 선정 테스트."""
+
+    def test_참여도_내림차순_최대_5개(self):
+        """참여도 높은 순으로 최대 5개만 반환."""
+        detector = TrendDetector()
+        posts = [_make_post(likes=likes) for likes in (10, 500, 30, 9000, 70, 2000, 5)]
+        result = detector.analyze("test", posts)
+        assert [p.engagement.likes for p in result.top_posts] == [9000, 2000, 500, 70, 30]
+
+    def test_참여도_같으면_원래_순서_유지(self):
+        """참여도가 같은 게시물은 먼저 수집된 게시물이 앞에 옴."""
+        detector = TrendDetector()
+        posts = [_make_post(text=f"게시물 {i}") for i in range(7)]
+        result = detector.analyze("test", posts)
+        assert [p.text for p in result.top_posts] == [f"게시물 {i}" for i in range(5)]
+
+
+class TestAnalyzeBatch:
+    """PostBatch 입력 테스트."""
+
+    def test_리스트_입력과_같은_결과(self):
+        """미리 만든 PostBatch를 넘겨도 게시물 리스트와 같은 결과."""
+        detector = TrendDetector()
+        now = datetime.now()
+        posts = [
+            _make_post(platform=Platform.THREADS, likes=500),
+            _make_post(platform=Platform.INSTAGRAM, likes=300, hours_ago=3),
+        ]
+        from_list = detector.analyze("test", posts, now=now)
+        from_batch = detector.analyze("test", PostBatch.from_posts(posts), now=now)
+        assert from_batch == from_list
+
+    def test_판정_집계는_게시물별_label과_일치(self):
+        """일괄 판정 집계는 PromotionSignal.label 기준과 같아야 함."""
+        detector = TrendDetector()
+        posts = [
+            _make_post(text="추천 #ad"),                   # 키워드 → Uncertain
+            _make_post(likes=500, comments=0, views=0),   # 급등 패턴만 → Organic
+            _make_post(text="일반 게시물"),                # 신호 없음 → Organic
+        ]
+        result = detector.analyze("test", posts)
+        labels = [detector._promo_detector.detect(p).label for p in posts]
+        assert result.organic_count == labels.count(PromotionLabel.ORGANIC)
+        assert result.paid_count == labels.count(PromotionLabel.PAID)
+        assert result.uncertain_count == labels.count(PromotionLabel.UNCERTAIN)